@@ -1,5 +1,6 @@
 from Class.CrearDataBaseSQL import DataBaseMySQL
 from Class.DataGuests import DataGuests
+from Class.QueryStats import QueryStats
 import os
 from dotenv import load_dotenv
 
@@ -7,9 +8,6 @@ load_dotenv()
 
 guest_excel=os.path.join(os.path.dirname(os.path.abspath(__file__)),"Data","guest.xlsx")
 
-#Cargar y actualizar archivo de invitados
-data=DataGuests()._frame
-
 config = {
     'user': os.getenv('db_user'),
     'password': os.getenv('db_password'),
@@ -18,6 +16,23 @@ config = {
     'port': os.getenv('db_port'),
 }
 
-db = DataBaseMySQL(host=config['host'], user=config['user'], password=config['password'], database_name=config['database'], port=config['port'])
-db.from_dataframe_create_table(name_table="Lista_de_invitados",df=data)
-db.close()
\ No newline at end of file
+stats = QueryStats(slow_threshold=float(os.getenv('slow_query_seconds', '1')))
+db = DataBaseMySQL(host=config['host'], user=config['user'], password=config['password'], database_name=config['database'], port=config['port'], stats=stats,
+                   local_infile=os.getenv('db_local_infile', '0') == '1')
+
+#Cargar y actualizar archivo de invitados, generando ID's que no existan en el archivo ni en la base de datos
+guests=DataGuests(db=db)
+#Los ID's nuevos tienen que quedar guardados en el archivo antes de subirlos; si el guardado falló se detiene aquí
+try:
+    guests.wait_saved()
+except Exception:
+    db.close()
+    raise
+data=guests._frame
+
+db.sync_dataframe_to_table(name_table="Lista_de_invitados",df=data,indexes=["MESA"])
+db.close()
+
+#Resumen del tiempo usado por cada tipo de sentencia durante la sincronización
+for operation, summary in stats.snapshot().items():
+    print(f"{operation}: {summary['count']} sentencias, {summary['rows']} filas, {summary['seconds']:.3f} s")
\ No newline at end of file
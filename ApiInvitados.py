@@ -0,0 +1,24 @@
+from Class.CrearDataBaseSQL import DataBaseMySQL
+from Class.LookupCache import LookupCache
+from Class.QueryStats import QueryStats
+from Class.GuestApi import run_server
+import logging
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+logging.basicConfig(level=logging.INFO)
+
+config = {
+    'user': os.getenv('db_user'),
+    'password': os.getenv('db_password'),
+    'host': os.getenv('cloud_sql_host'),
+    'database': os.getenv('db_name'),
+    'port': os.getenv('db_port'),
+}
+
+#Servidor de consulta de invitados en GET /api/<id>, con caché de consultas y métricas SQL en GET /metrics
+stats = QueryStats(slow_threshold=float(os.getenv('slow_query_seconds', '0.5')))
+db = DataBaseMySQL(host=config['host'], user=config['user'], password=config['password'], database_name=config['database'], port=config['port'], cache=LookupCache(), stats=stats)
+run_server(db, port=int(os.getenv('api_port', '8080')))
+db.close()
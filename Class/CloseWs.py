@@ -1,7 +1,10 @@
 import os
-import win32com.client
+import sys
 import logging
 
+# Excel y Word sólo se pueden cerrar en Windows; en otros sistemas las funciones no hacen nada
+IS_WINDOWS = sys.platform == "win32"
+
 class FailCloseWs(Exception):
     """Excepcion que se lanza cuando no se puede cerrar excel o word al
     ejecutar la clase CloseWs"""
@@ -12,6 +15,11 @@ class FailCloseWs(Exception):
         return self.msg
 
 class CloseWs:
+    """Cierra Excel y Word para que no bloqueen los archivos que se van a modificar.
+
+    win32com (pywin32) se importa sólo al cerrar los programas, por lo que importar esta clase no tiene costo
+    y en sistemas distintos de Windows las funciones no hacen nada y devuelven True.
+    """
     
     @staticmethod
     def cerrar_excel_y_word() -> bool:
@@ -42,8 +50,11 @@ class CloseWs:
         Returns:
             bool: True - Excel ya no se ejecuta
         """
+        if not IS_WINDOWS:
+            return True
         try:
             try:
+                import win32com.client
                 excel = win32com.client.GetActiveObject("Excel.Application")
                 excel.Quit()
                 os.system("taskkill /f /im excel.exe")
@@ -64,8 +75,11 @@ class CloseWs:
         Returns:
             bool: True - Word ya no se ejecuta
         """
+        if not IS_WINDOWS:
+            return True
         try:         
             try:
+                import win32com.client
                 word = win32com.client.GetActiveObject("Word.Application")
                 docs = word.Documents
                 for doc in docs:
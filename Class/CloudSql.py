@@ -1,6 +1,6 @@
 import os
 from dotenv import load_dotenv
-import mysql.connector
+from Class.CrearDataBaseSQL import DataBaseMySQL
 
 load_dotenv()
 
@@ -11,6 +11,21 @@ config = {
     'password': os.getenv('db_password'),
     'host': os.getenv('cloud_sql_host'),
     'database': os.getenv('db_name'),
+    'port': os.getenv('db_port', '3306'),
 }
 
-cnx = mysql.connector.connect(**config)
+_database = None
+
+def get_database() -> DataBaseMySQL:
+    """Devuelve una única instancia de DataBaseMySQL compartida por todo el proceso,
+    creándola en el primer uso en lugar de conectarse al importar el módulo.
+    Sus conexiones provienen del pool de DataBaseMySQL, por lo que puede usarse desde varios hilos.
+
+    Returns:
+        DataBaseMySQL: Base de datos configurada con las variables de entorno.
+    """
+    global _database
+    if _database is None:
+        _database = DataBaseMySQL(host=config['host'], user=config['user'], password=config['password'],
+                                  database_name=config['database'], port=config['port'])
+    return _database
@@ -0,0 +1,164 @@
+import collections
+import contextlib
+import logging
+import threading
+import time
+
+
+class FailPool(Exception):
+    """Excepción que se lanza cuando no se puede obtener una conexión del pool."""
+    def __init__(self, message):
+        """Inicializa la excepción con un mensaje de error."""
+        self.message = message
+
+    def __str__(self):
+        return self.message
+
+
+class ConnectionPool:
+    """Pool de conexiones de tamaño acotado y seguro para hilos.
+
+    Las conexiones se reutilizan entre consultas para no pagar el establecimiento de TCP, TLS y autenticación
+    en cada llamada. Antes de entregar una conexión que estuvo inactiva se verifica con `ping` y, si estuvo
+    inactiva demasiado tiempo, se cierra y se reemplaza por una nueva.
+
+    Atributos:
+        max_size (int): Cantidad máxima de conexiones abiertas a la vez.
+        ping_after (float): Segundos de inactividad a partir de los cuales se hace ping antes de entregar la conexión.
+        recycle (float): Segundos de inactividad a partir de los cuales la conexión se cierra y se abre una nueva.
+        timeout (float): Segundos máximos de espera por una conexión libre cuando el pool está lleno.
+    """
+
+    def __init__(self, connect, max_size:int = 5, ping_after:float = 30, recycle:float = 300, timeout:float = 30):
+        """Inicializa el pool sin abrir conexiones; estas se crean a demanda.
+
+        Args:
+            connect (callable): Función sin argumentos que abre y devuelve una nueva conexión.
+            max_size (int, optional): Cantidad máxima de conexiones abiertas a la vez. Defaults to 5.
+            ping_after (float, optional): Segundos de inactividad antes de verificar la conexión con ping. Defaults to 30.
+            recycle (float, optional): Segundos de inactividad antes de reemplazar la conexión. Defaults to 300.
+            timeout (float, optional): Segundos máximos de espera por una conexión libre. Defaults to 30.
+        """
+        if max_size < 1:
+            raise ValueError("max_size debe ser mayor a 0")
+        self._connect = connect
+        self.max_size = max_size
+        self.ping_after = ping_after
+        self.recycle = recycle
+        self.timeout = timeout
+        self._idle = collections.deque()
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    @property
+    def size(self) -> int:
+        """Cantidad de conexiones abiertas, tanto libres como en uso."""
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        """Cantidad de conexiones libres dentro del pool."""
+        return len(self._idle)
+
+    def acquire(self):
+        """Entrega una conexión del pool, abriendo una nueva si no hay libres y no se alcanzó `max_size`.
+
+        Returns:
+            Conexión lista para usarse. Debe devolverse con `release`.
+
+        Raises:
+            FailPool: Si no se libera ninguna conexión dentro de `timeout` segundos o no se puede abrir una nueva.
+        """
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise FailPool("El pool de conexiones está cerrado")
+                if self._idle:
+                    # LIFO: se reutiliza la conexión usada más recientemente, que es la que menos riesgo tiene de estar caída
+                    conn, last_used = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    conn, last_used = None, None
+                    break
+                if not self._condition.wait(self.timeout):
+                    raise FailPool(f"No hay conexiones libres después de {self.timeout} s")
+
+        try:
+            if conn is None:
+                return self._connect()
+
+            idle_time = time.monotonic() - last_used
+            if idle_time >= self.recycle:
+                self._close_quietly(conn)
+                return self._connect()
+            if idle_time >= self.ping_after:
+                try:
+                    conn.ping(reconnect=True)
+                except Exception:
+                    self._close_quietly(conn)
+                    return self._connect()
+            return conn
+
+        except Exception as e:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            logging.error(f"ConnectionPool : No se pudo abrir una conexión: {str(e)}")
+            raise FailPool(f"No se pudo abrir una conexión: {str(e)}")
+
+    def release(self, conn, discard:bool = False) -> None:
+        """Devuelve una conexión al pool.
+
+        Args:
+            conn: Conexión obtenida con `acquire`.
+            discard (bool, optional): Si es True la conexión se cierra en lugar de reutilizarse. Defaults to False.
+        """
+        with self._condition:
+            discard = discard or self._closed
+            if discard:
+                self._close_quietly(conn)
+                self._size -= 1
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._condition.notify()
+
+    @contextlib.contextmanager
+    def connection(self):
+        """Context manager que entrega una conexión y la devuelve al pool al salir.
+        Si ocurre un error dentro del bloque se hace rollback, y si el rollback falla la conexión se descarta.
+
+        Yields:
+            Conexión lista para usarse.
+        """
+        conn = self.acquire()
+        try:
+            yield conn
+        except BaseException:
+            try:
+                conn.rollback()
+            except Exception:
+                self.release(conn, discard=True)
+            else:
+                self.release(conn)
+            raise
+        else:
+            self.release(conn)
+
+    def close(self) -> None:
+        """Cierra todas las conexiones libres del pool. Las conexiones en uso se cierran al devolverse."""
+        with self._condition:
+            self._closed = True
+            while self._idle:
+                conn, _ = self._idle.pop()
+                self._close_quietly(conn)
+                self._size -= 1
+
+    @staticmethod
+    def _close_quietly(conn) -> None:
+        """Cierra una conexión ignorando errores, por ejemplo si el socket ya estaba cerrado."""
+        try:
+            conn.close()
+        except Exception:
+            pass
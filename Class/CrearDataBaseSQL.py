@@ -1,7 +1,17 @@
 import pymysql
+import pymysql.cursors
 import logging
 import pandas as pd
 import json
+import os
+import re
+import tempfile
+import time
+import threading
+import contextlib
+from Class.ConnectionPool import ConnectionPool
+from Class.LookupCache import LookupCache
+from Class.QueryStats import QueryStats
 
 
 class FailConect(Exception):
@@ -13,6 +23,29 @@ class FailConect(Exception):
     def __str__(self):
         return self.message
 
+class FailLocalInfile(FailConect):
+    """Excepción que se lanza cuando el servidor o el cliente no permiten LOAD DATA LOCAL INFILE."""
+
+# Valores que se guardan como NULL en la base de datos
+NULL_VALUES = ['None', 'none', 'NULL', 'null', 'Null', '']
+
+# Rangos (con signo, sin signo) de los tipos enteros de MySQL, del más pequeño al más grande
+INTEGER_TYPES = [('TINYINT', 127, 255),
+                 ('SMALLINT', 32767, 65535),
+                 ('MEDIUMINT', 8388607, 16777215),
+                 ('INT', 2147483647, 4294967295),
+                 ('BIGINT', 9223372036854775807, 18446744073709551615)]
+
+# Errores de MySQL/MariaDB cuando un valor no cabe en el tipo de su columna: fuera de rango, truncado,
+# valor incorrecto para el tipo, fecha incorrecta y texto demasiado largo
+SCHEMA_ERRORS = {1264, 1265, 1292, 1366, 1406}
+
+# Errores de MySQL/MariaDB cuando LOAD DATA LOCAL está deshabilitado en el servidor o en el cliente
+LOCAL_INFILE_ERRORS = {1148, 2068, 3948, 3950}
+
+# Secuencias de escape de LOAD DATA con ESCAPED BY '\\'
+INFILE_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r", "\0": "\\0", "\x1a": "\\Z"})
+
 class DataBaseMySQL:
     """Clase que representa una base de datos MySQL.
 
@@ -22,10 +55,19 @@ class DataBaseMySQL:
         user (str): El nombre de usuario para conectarse a la base de datos.
         password (str): La contraseña para conectarse a la base de datos.
         database_name (str): El nombre de la base de datos.
-        conn (pymysql.connections.Connection): La conexión a la base de datos.
+        pool (ConnectionPool): Pool de conexiones reutilizadas por todas las consultas.
+        conn (pymysql.connections.Connection): La conexión tomada del pool por el hilo actual, None fuera de `checkout`.
+        cache (LookupCache): Caché opcional de las consultas de invitados por ID.
+        stats (QueryStats): Métricas opcionales de las sentencias ejecutadas.
+        local_infile (bool): Si es True las cargas completas usan LOAD DATA LOCAL INFILE en lugar de INSERT.
     """
+    
+    GUEST_TABLE = "Lista_de_invitados"
+    GUEST_COLUMNS = ["ID", "SEX", "APELLIDOS", "NOMBRES", "NUMBER_GUEST", "MESA", "CELULAR", "CONFIRMADO"]
 
-    def __init__(self , host: str, port: str , user: str, password: str, database_name: str):
+    def __init__(self , host: str, port: str , user: str, password: str, database_name: str,
+                 pool_size:int = 5, pool_recycle:float = 300, cache: LookupCache = None, stats: QueryStats = None,
+                 local_infile:bool = False):
         """Inicializa los atributos de la clase.
 
         Args:
@@ -34,30 +76,52 @@ class DataBaseMySQL:
             user (str): El nombre de usuario para conectarse a la base de datos.
             password (str): La contraseña para conectarse a la base de datos.
             database_name (str): El nombre de la base de datos existente ya en el servidor mysql.
+            pool_size (int, optional): Cantidad máxima de conexiones abiertas a la vez. Defaults to 5.
+            pool_recycle (float, optional): Segundos de inactividad tras los cuales una conexión se reemplaza. Defaults to 300.
+            cache (LookupCache, optional): Caché para `consultar_id_and_return_json`. Se invalida automáticamente
+                al modificar la tabla de invitados. Defaults to None, sin caché.
+            stats (QueryStats, optional): Métricas donde se registra la duración y las filas de cada sentencia.
+                Defaults to None, sin métricas.
+            local_infile (bool, optional): Habilita LOAD DATA LOCAL INFILE en las conexiones para que
+                `from_dataframe_create_table` cargue las filas desde un archivo CSV. El servidor también debe tenerlo
+                habilitado (`local_infile=1`); si no, se usan INSERT por lotes. Defaults to False.
         """
         self.host = host
         self.port = int(port)
         self.user = user
         self.password = password
         self.database_name = database_name
-        self.conn = self.connect()
+        self.cache = cache
+        self.stats = stats
+        self.local_infile = local_infile
+        self._local = threading.local()
+        self.pool = ConnectionPool(self.connect, max_size=pool_size, recycle=pool_recycle)
+        # Abre la primera conexión para validar las credenciales al crear el objeto
+        try:
+            with self.checkout():
+                pass
+        except Exception as e:
+            logging.error(f"Error al conectar a base de datos: {str(e)}")
+            raise FailConect("No se pudo establecer una conexión con la base de datos")
 
 
     def connect(self) -> pymysql.connections.Connection:
-        """Intenta establecer una conexión con la base de datos.
+        """Intenta establecer una nueva conexión con la base de datos.
+        Es usada por el pool de conexiones, por lo que normalmente no se llama directamente.
 
-        Si la conexión se realiza con éxito, muestra un mensaje de éxito. Si ocurre un error al conectarse, muestra un
-        mensaje de error.
+        Si ocurre un error al conectarse, muestra un mensaje de error.
         """
         try:
-            self.conn = pymysql.Connect(
+            return pymysql.Connect(
                 host=self.host,
                 port=self.port,
                 user=self.user,
                 passwd=self.password,
-                db=self.database_name
+                db=self.database_name,
+                local_infile=self.local_infile,
+                # Un valor que no cabe en su columna debe dar error y no truncarse, sin importar el sql_mode del servidor
+                init_command="SET SESSION sql_mode = CONCAT_WS(',', NULLIF(@@SESSION.sql_mode, ''), 'STRICT_ALL_TABLES')"
             )
-            return self.conn
         
         except Exception as e:
             logging.error(f"Error al conectar a base de datos: {str(e)}")
@@ -65,29 +129,140 @@ class DataBaseMySQL:
             
     
     
+    @property
+    def conn(self) -> pymysql.connections.Connection or None:
+        """Conexión tomada del pool por el hilo actual dentro de `checkout`, o None."""
+        return getattr(self._local, "conn", None)
+    
+    @contextlib.contextmanager
+    def checkout(self):
+        """Context manager que toma una conexión del pool y la devuelve al salir.
+        Las llamadas anidadas dentro del mismo hilo reutilizan la misma conexión, de modo que
+        varios comandos pueden formar parte de una misma transacción.
+
+        Yields:
+            pymysql.connections.Connection: Conexión asignada al hilo actual.
+
+        Raises:
+            FailPool: Si no se puede obtener una conexión del pool.
+        """
+        if self.conn is not None:
+            yield self.conn
+            return
+        with self.pool.connection() as conn:
+            self._local.conn = conn
+            try:
+                yield conn
+            finally:
+                self._local.conn = None
+    
     def close(self) -> None:
-        """Intenta cerrar la conexión con la base de datos.
+        """Intenta cerrar las conexiones del pool con la base de datos.
 
-        Si la conexión se cierra con éxito, muestra un mensaje de éxito. Si ocurre un error al cerrar la conexión, muestra
-        un mensaje de error.
+        Si ocurre un error al cerrar las conexiones, muestra un mensaje de error.
         """
         try:
-            self.conn.close()
-            self.conn= None
+            self.pool.close()
         except Exception as e:
             logging.error(f"Error al cerrar conexión: {str(e)}")
             raise FailConect(f"Ocurrio un error : {str(e)} ")
     
-    def cursor_execute_command(self,*args) -> tuple or None :
+    def record_query(self, statement:str, start:float, rows:int = 0, error:bool = False) -> None:
+        """Registra en `stats` una sentencia que empezó en `start` (time.perf_counter), si hay métricas."""
+        if self.stats is not None:
+            self.stats.record(statement, time.perf_counter() - start, rows=rows, error=error)
+    
+    def commit(self, conn) -> None:
+        """Hace commit de la conexión registrando su duración en las métricas.
+        Dentro de `transaction` no hace nada: la transacción decide cuándo hacer commit.
+        """
+        if getattr(self._local, "transaction", None) is None:
+            self._commit(conn)
+    
+    def _commit(self, conn) -> None:
+        """Hace commit de inmediato, aunque haya una transacción abierta, y reinicia su cuenta de sentencias."""
+        start = time.perf_counter()
+        conn.commit()
+        self.record_query("COMMIT", start)
+        transaction = getattr(self._local, "transaction", None)
+        if transaction is not None:
+            transaction["pending"] = 0
+            # La caché se invalida recién ahora, para que otro hilo no la vuelva a llenar con filas sin commit
+            invalidations, transaction["invalidate"] = transaction["invalidate"], []
+            for keys in invalidations:
+                self.cache.invalidate(keys)
+    
+    def count_statement(self, conn) -> None:
+        """Cuenta una sentencia ejecutada dentro de `transaction` y hace commit al llegar a `commit_every`."""
+        transaction = getattr(self._local, "transaction", None)
+        if transaction is None or transaction["commit_every"] is None:
+            return
+        transaction["pending"] += 1
+        if transaction["pending"] >= transaction["commit_every"]:
+            self._commit(conn)
+    
+    @contextlib.contextmanager
+    def transaction(self, commit_every:int = None):
+        """Context manager que agrupa en una transacción todos los comandos ejecutados dentro del bloque
+        por el hilo actual, en lugar de hacer un commit por cada llamada.
+
+        Al salir del bloque se hace commit; si ocurre un error se hace rollback de lo que no se guardó y el error
+        se propaga. Con `commit_every` se hace además un commit cada esa cantidad de sentencias (cada lote de
+        `cursor_executemany_command` cuenta como una), para no mantener una transacción enorme abierta en
+        cargas grandes; en ese caso un error sólo deshace las sentencias desde el último commit.
+        Las transacciones anidadas forman parte de la transacción exterior.
+        Los comandos DDL (CREATE, DROP, RENAME, etc.) hacen commit implícito en MySQL; para reconstruir
+        una tabla de forma atómica se usa `shadow_table`.
+
+        Ejemplo:
+            with db.transaction(commit_every=1000):
+                db.delete_from_table("tabla", "MESA = 3")
+                db.insert_into_table("tabla", columnas, filas)
+
+        Args:
+            commit_every (int, optional): Cantidad de sentencias entre commits. Defaults to None, un solo commit al final.
+
+        Yields:
+            pymysql.connections.Connection: Conexión usada por la transacción.
+
+        Raises:
+            ValueError: Si `commit_every` es menor a 1.
+        """
+        if getattr(self._local, "transaction", None) is not None:
+            yield self.conn
+            return
+        if commit_every is not None and commit_every < 1:
+            raise ValueError("commit_every debe ser mayor a 0")
+        with self.checkout() as conn:
+            self._local.transaction = {"commit_every": commit_every, "pending": 0, "invalidate": []}
+            try:
+                yield conn
+                self._commit(conn)
+            except BaseException:
+                # Si el rollback falla la conexión está caída; el pool la descarta al devolverla
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
+                raise
+            finally:
+                self._local.transaction = None
+    
+    def cursor_execute_command(self,*args, params:tuple = None, commit:bool = True) -> tuple or None :
         """
         Crea un cursor y ejecuta los comandos que se le pasen como argumentos.
         Este método se usa para ejecutar comandos de tipo DDL (Data Definition Language)
         como CREATE, ALTER, DROP, TRUNCATE, RENAME, etc.
 
         Este método será usado por otros métodos de la clase DataBase.
+        Si hay métricas (`stats`), se registra la duración y las filas de cada comando.
 
         Args:
             *args (str): Uno o más comandos a ejecutar.
+            params (tuple, optional): Valores para los marcadores %s de los comandos, escapados por pymysql.
+                Defaults to None.
+            commit (bool, optional): Si es False no se hace commit, permitiendo agrupar varios comandos
+                en una misma transacción dentro de `checkout`. Defaults to True.
 
         Returns:
             objeto (tuple o None): Retorna la respuesta al último comando ejecutado,
@@ -98,24 +273,98 @@ class DataBaseMySQL:
             FailConect: Si se produce un error al ejecutar los comandos.
         """
         try:
-            cursor=self.conn.cursor()
-            for arg in args:
-                cursor.execute(arg)
-                objeto=cursor.fetchall()
-            self.conn.commit()
-            cursor.close()
-            return objeto
+            with self.checkout() as conn:
+                cursor=conn.cursor()
+                for arg in args:
+                    start=time.perf_counter()
+                    try:
+                        cursor.execute(arg, params)
+                        objeto=cursor.fetchall()
+                    except Exception:
+                        self.record_query(arg, start, error=True)
+                        raise
+                    self.record_query(arg, start, max(cursor.rowcount, 0))
+                    self.count_statement(conn)
+                if commit:
+                    self.commit(conn)
+                cursor.close()
+                return objeto
         except Exception as e:
             logging.error(f"Error al ejecutar comando: {str(e)}")
-            raise FailConect(f"Error de comandos : {str(e)} ")
+            raise FailConect(f"Error de comandos : {str(e)} ") from e
+    
+    def cursor_executemany_command(self, command:str, values:list[tuple], batch_size:int = 500, commit:bool = True) -> int:
+        """
+        Crea un cursor y ejecuta un mismo comando parametrizado para una lista de valores,
+        enviándolos por lotes de `batch_size` filas con `executemany`.
+        Para comandos INSERT ... VALUES, pymysql agrupa cada lote en una sola sentencia de múltiples filas,
+        por lo que se realiza un solo viaje de red por lote y un solo commit al final.
+        Si hay métricas (`stats`), se registra la duración y las filas de cada lote.
+
+        Args:
+            command (str): Comando parametrizado con marcadores %s, por ejemplo "INSERT INTO tabla (a,b) VALUES (%s,%s)".
+            values (list[tuple]): Lista de tuplas con los valores de cada fila.
+            batch_size (int, optional): Cantidad de filas enviadas por lote. Defaults to 500.
+            commit (bool, optional): Si es False no se hace commit, permitiendo agrupar varios comandos
+                en una misma transacción dentro de `checkout`. Defaults to True.
+
+        Returns:
+            int: Cantidad de filas afectadas.
+
+        Raises:
+            FailConect: Si se produce un error al ejecutar el comando.
+        """
+        try:
+            if batch_size < 1:
+                raise ValueError("batch_size debe ser mayor a 0")
+            with self.checkout() as conn:
+                cursor=conn.cursor()
+                rows=0
+                for start in range(0, len(values), batch_size):
+                    started=time.perf_counter()
+                    try:
+                        affected = cursor.executemany(command, values[start:start + batch_size]) or 0
+                    except Exception:
+                        self.record_query(command, started, error=True)
+                        raise
+                    self.record_query(command, started, affected)
+                    self.count_statement(conn)
+                    rows += affected
+                if commit:
+                    self.commit(conn)
+                cursor.close()
+                return rows
+        except Exception as e:
+            logging.error(f"Error al ejecutar comando: {str(e)}")
+            raise FailConect(f"Error de comandos : {str(e)} ") from e
             
     
     
+    def invalidate_cache(self, name_table:str, keys:list[str] = None) -> None:
+        """Invalida la caché de consultas si se modificó la tabla de invitados.
+
+        Dentro de `transaction` la invalidación se hace después del commit, para que una consulta concurrente
+        no vuelva a guardar en la caché las filas anteriores al commit.
+
+        Args:
+            name_table (str): Nombre de la tabla modificada.
+            keys (list[str], optional): IDs modificados. Si es None se vacía toda la caché. Defaults to None.
+        """
+        if self.cache is None or name_table != self.GUEST_TABLE:
+            return
+        transaction = getattr(self._local, "transaction", None)
+        if transaction is not None:
+            transaction["invalidate"].append(None if keys is None else list(keys))
+            return
+        self.cache.invalidate(keys)
+    
+    
     def drop_table(self, name_table) -> None:
         """Se eliminará una tabla especificada dentro de la base de datos."""
         try:
             command= f"""DROP TABLE IF EXISTS {name_table}"""
             self.cursor_execute_command(command)
+            self.invalidate_cache(name_table)
             
         except Exception as e:
             logging.error(f"Error al eliminar tabla: {str(e)}")
@@ -140,6 +389,53 @@ class DataBaseMySQL:
             logging.error(f"Error al crear tabla: {str(e)}")
             raise FailConect(f"Ocurrio un error : {str(e)} ")
     
+    @contextlib.contextmanager
+    def shadow_table(self, name_table:str):
+        """Context manager para reconstruir una tabla sin que quienes la leen la encuentren vacía o inexistente.
+
+        El nuevo contenido se construye en una tabla auxiliar `<name_table>__new` y, al salir del bloque sin errores,
+        se intercambia con la tabla actual mediante un único `RENAME TABLE`, que es atómico: las consultas ven
+        la tabla anterior completa hasta el intercambio y la nueva completa después. Luego se elimina la tabla
+        anterior. Si ocurre un error, se elimina la tabla auxiliar y la tabla actual queda intacta.
+
+        Ejemplo:
+            with db.shadow_table("Lista_de_invitados") as shadow:
+                db.create_table(shadow, campos)
+                db.bulk_insert_into_table(shadow, columnas, filas)
+
+        Args:
+            name_table (str): Nombre de la tabla a reconstruir.
+
+        Yields:
+            str: Nombre de la tabla auxiliar donde se debe construir el nuevo contenido.
+
+        Raises:
+            FailConect: Error al intercambiar las tablas.
+        """
+        shadow = f"{name_table}__new"
+        old = f"{name_table}__old"
+        # Restos de una reconstrucción anterior que se interrumpió
+        self.drop_table(shadow)
+        try:
+            yield shadow
+        except BaseException:
+            try:
+                self.drop_table(shadow)
+            except FailConect:
+                pass
+            raise
+        try:
+            self.drop_table(old)
+            if self.get_table_columns(name_table):
+                self.cursor_execute_command(f"RENAME TABLE {name_table} TO {old}, {shadow} TO {name_table}")
+                self.drop_table(old)
+            else:
+                self.cursor_execute_command(f"RENAME TABLE {shadow} TO {name_table}")
+            self.invalidate_cache(name_table)
+        except Exception as e:
+            logging.error(f"Error al intercambiar tablas: {str(e)}")
+            raise FailConect(f"Ocurrio un error : {str(e)} ")
+    
     def insert_into_table(self, name_table:str, columns : list[str], values: list[tuple]):
         """
         Inserta una serie de valores en una tabla determinada.
@@ -160,12 +456,143 @@ class DataBaseMySQL:
                 insert_query = f"INSERT INTO {name_table} ({','.join(columns)}) VALUES {value}"
                 insert_query_list.append(insert_query)
             self.cursor_execute_command(*insert_query_list)
+            self.invalidate_cache(name_table)
             
         except Exception as e:
             logging.error(f"Error al insertar datos: {str(e)}")
             raise FailConect(f"Ocurrio un error : {str(e)} ")
     
-    def select_from_table(self, name_table:str, columns : list[str] = None, where : str = None) -> list[tuple]:
+    def bulk_insert_into_table(self, name_table:str, columns : list[str], values: list[tuple], batch_size:int = 500) -> float:
+        """
+        Inserta una serie de valores en una tabla determinada mediante sentencias parametrizadas
+        de múltiples filas, enviadas por lotes de `batch_size` filas.
+        Registra en el log la velocidad de inserción para poder ajustar el tamaño del lote.
+
+        Args:
+            name_table (str): Nombre de la tabla en la que se insertarán los valores.
+            columns (List[str]): Lista de nombres de las columnas en las que se insertarán los valores.
+            values (List[tuple]): Lista de tuplas con los valores a insertar en las columnas correspondientes.
+            batch_size (int, optional): Cantidad de filas por sentencia INSERT. Defaults to 500.
+
+        Returns:
+            float: Filas insertadas por segundo.
+
+        Raises:
+            FailConect: Error al insertar datos.
+        """
+        try:
+            values=[tuple(value) for value in values]
+            placeholders=",".join(["%s"] * len(columns))
+            insert_query = f"INSERT INTO {name_table} ({','.join(columns)}) VALUES ({placeholders})"
+            
+            start=time.perf_counter()
+            self.cursor_executemany_command(insert_query, values, batch_size=batch_size)
+            elapsed=time.perf_counter() - start
+            self.invalidate_cache(name_table)
+            
+            rows_per_second = len(values) / elapsed if elapsed > 0 else float(len(values))
+            logging.info(f"{name_table}: {len(values)} filas insertadas en {elapsed:.3f} s "
+                         f"({rows_per_second:.1f} filas/s, lote de {batch_size})")
+            return rows_per_second
+            
+        except Exception as e:
+            logging.error(f"Error al insertar datos: {str(e)}")
+            raise FailConect(f"Ocurrio un error : {str(e)} ")
+    
+    @staticmethod
+    def write_infile_csv(df: pd.DataFrame, file, chunk_rows:int = 100000) -> int:
+        """Escribe un dataframe como CSV para LOAD DATA, columna por columna y por bloques de `chunk_rows` filas.
+
+        Cada valor se escribe entre comillas dobles escapando \\, ", saltos de línea, \\0 y \\Z con \\, y los valores
+        nulos se escriben como \\N, con las mismas reglas que `update_table` e `is_null`: None, NaN y las cadenas
+        de NULL_VALUES se guardan como NULL. Los booleanos se escriben como 1 y 0.
+
+        Args:
+            df (pd.DataFrame): Dataframe a escribir.
+            file: Archivo de texto abierto para escritura.
+            chunk_rows (int, optional): Cantidad de filas convertidas a la vez. Defaults to 100000.
+
+        Returns:
+            int: Cantidad de filas escritas.
+        """
+        for start in range(0, len(df), chunk_rows):
+            chunk = df.iloc[start:start + chunk_rows]
+            fields = []
+            for column in chunk.columns:
+                series = chunk[column]
+                values = series.astype(object)
+                null = values.isna() | values.isin(NULL_VALUES)
+                if str(series.dtype) == 'bool':
+                    text = series.map({True: "1", False: "0"})
+                else:
+                    text = values.astype(str).str.translate(INFILE_ESCAPES)
+                fields.append(('"' + text + '"').mask(null, "\\N"))
+            if fields:
+                lines = fields[0].str.cat(fields[1:], sep=",") if len(fields) > 1 else fields[0]
+                file.write("\n".join(lines.tolist()))
+                file.write("\n")
+        return len(df)
+    
+    def load_data_infile(self, name_table:str, df: pd.DataFrame, chunk_rows:int = 100000) -> float:
+        """
+        Carga las filas de un dataframe en una tabla existente con LOAD DATA LOCAL INFILE, el cargador masivo
+        de MySQL, a partir de un archivo CSV temporal escrito por `write_infile_csv`.
+        Las columnas del dataframe deben existir en la tabla; se cargan por nombre.
+
+        Args:
+            name_table (str): Nombre de la tabla en la que se cargarán las filas.
+            df (pd.DataFrame): Dataframe con las filas a cargar.
+            chunk_rows (int, optional): Cantidad de filas convertidas a la vez al escribir el CSV. Defaults to 100000.
+
+        Returns:
+            float: Filas cargadas por segundo.
+
+        Raises:
+            FailLocalInfile: Si el servidor o la conexión no permiten LOAD DATA LOCAL INFILE.
+            FailConect: Si no se cargaron todas las filas u ocurre otro error.
+        """
+        start=time.perf_counter()
+        fd, path = tempfile.mkstemp(prefix=f"{name_table}_", suffix=".csv")
+        try:
+            # El archivo se cierra antes de cargarlo porque en Windows no puede abrirse dos veces
+            with os.fdopen(fd, "w", encoding="utf-8", newline="") as file:
+                self.write_infile_csv(df, file, chunk_rows=chunk_rows)
+            command = (f"LOAD DATA LOCAL INFILE %s INTO TABLE {name_table} CHARACTER SET utf8mb4 "
+                       f"FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '\\\\' "
+                       f"LINES TERMINATED BY '\\n' ({','.join(df.columns)})")
+            with self.checkout() as conn:
+                cursor=conn.cursor()
+                started=time.perf_counter()
+                try:
+                    cursor.execute(command, (path,))
+                except pymysql.err.MySQLError as e:
+                    # No se hace rollback aquí: lo hace quien es dueño de la conexión (`transaction` o el pool),
+                    # para no deshacer las sentencias anteriores de una transacción abierta por quien llama
+                    self.record_query(command, started, error=True)
+                    if e.args and e.args[0] in LOCAL_INFILE_ERRORS:
+                        raise FailLocalInfile(f"LOAD DATA LOCAL INFILE no está permitido: {str(e)}") from e
+                    raise FailConect(f"Error de comandos : {str(e)} ") from e
+                loaded = max(cursor.rowcount, 0)
+                self.record_query(command, started, loaded)
+                # Con LOCAL los errores de datos (llaves duplicadas, valores que no caben) son sólo advertencias
+                if loaded != len(df):
+                    cursor.execute("SHOW WARNINGS LIMIT 5")
+                    warnings = "; ".join(str(row[2]) for row in cursor.fetchall())
+                    cursor.close()
+                    raise FailConect(f"{name_table}: se cargaron {loaded} de {len(df)} filas ({warnings})")
+                self.commit(conn)
+                cursor.close()
+        finally:
+            os.remove(path)
+        elapsed=time.perf_counter() - start
+        self.invalidate_cache(name_table)
+        
+        rows_per_second = len(df) / elapsed if elapsed > 0 else float(len(df))
+        logging.info(f"{name_table}: {len(df)} filas cargadas con LOAD DATA en {elapsed:.3f} s "
+                     f"({rows_per_second:.1f} filas/s)")
+        return rows_per_second
+    
+    def select_from_table(self, name_table:str, columns : list[str] = None, where : str = None, params:tuple = None) -> list[tuple]:
         """
         Selecciona una serie de valores de una tabla determinada.
 
@@ -173,6 +600,7 @@ class DataBaseMySQL:
             table_name (str): Nombre de la tabla de la que se seleccionarán los valores.
             columns (List[str]): Lista de nombres de las columnas de las que se seleccionarán los valores.
             where (str, optional): Condición para filtrar los valores. Defaults to None.
+            params (tuple, optional): Valores para los marcadores %s del where. Defaults to None.
 
         Returns:
             List[tuple]: Lista de tuplas con los valores seleccionados.
@@ -180,20 +608,119 @@ class DataBaseMySQL:
         try:
             if columns:
                 select_query = f"SELECT {','.join(columns)} FROM {name_table}"
-            select_query= f"SELECT * FROM {name_table}"
+            else:
+                select_query= f"SELECT * FROM {name_table}"
+            if where:
+                select_query += f" WHERE {where}"
+            return self.cursor_execute_command(select_query, params=params)
+        except Exception as e:
+            logging.error(f"Error al seleccionar datos: {str(e)}")
+            raise FailConect(f"Ocurrio un error : {str(e)} ")
+    
+    def stream_from_table(self, name_table:str, columns : list[str] = None, where : str = None, params:tuple = None,
+                          fetch_size:int = 1000, as_dataframe:bool = False, dtype = None):
+        """
+        Selecciona valores de una tabla de forma progresiva con un cursor del lado del servidor (SSCursor),
+        leyendo `fetch_size` filas a la vez, de modo que nunca se carga todo el resultado en memoria.
+        Usa una conexión propia del pool mientras dure la lectura, por lo que otras consultas
+        pueden ejecutarse entre una iteración y otra.
+
+        Args:
+            name_table (str): Nombre de la tabla de la que se seleccionarán los valores.
+            columns (List[str], optional): Columnas a seleccionar. Defaults to None, todas las columnas.
+            where (str, optional): Condición para filtrar los valores. Defaults to None.
+            params (tuple, optional): Valores para los marcadores %s del where. Defaults to None.
+            fetch_size (int, optional): Cantidad de filas leídas del servidor en cada llamada. Defaults to 1000.
+            as_dataframe (bool, optional): Si es True se generan DataFrames de hasta `fetch_size` filas
+                en lugar de tuplas. Defaults to False.
+            dtype (optional): Tipos aplicados a cada DataFrame con `astype`, por ejemplo {"MESA": "int64"}.
+                Defaults to None.
+
+        Yields:
+            tuple or pd.DataFrame: Cada fila seleccionada, o cada bloque de filas si `as_dataframe` es True.
+
+        Raises:
+            FailConect: Error al seleccionar datos.
+        """
+        try:
+            if fetch_size < 1:
+                raise ValueError("fetch_size debe ser mayor a 0")
+            select_query = f"SELECT {','.join(columns) if columns else '*'} FROM {name_table}"
             if where:
                 select_query += f" WHERE {where}"
-            return self.cursor_execute_command(select_query)
+            
+            with self.pool.connection() as conn:
+                cursor = conn.cursor(pymysql.cursors.SSCursor)
+                start = time.perf_counter()
+                seconds = None
+                streamed = 0
+                try:
+                    try:
+                        cursor.execute(select_query, params)
+                    except Exception:
+                        self.record_query(select_query, start, error=True)
+                        raise
+                    # Se registra sólo el tiempo de la consulta; el de leer las filas depende de quien las consume
+                    seconds = time.perf_counter() - start
+                    names = [description[0] for description in cursor.description]
+                    while True:
+                        rows = cursor.fetchmany(fetch_size)
+                        if not rows:
+                            break
+                        streamed += len(rows)
+                        if as_dataframe:
+                            chunk = pd.DataFrame(list(rows), columns=names)
+                            yield chunk if dtype is None else chunk.astype(dtype)
+                        else:
+                            yield from rows
+                finally:
+                    # Cerrar el cursor descarta las filas no leídas para poder reutilizar la conexión
+                    cursor.close()
+                    # Termina la transacción de la lectura antes de devolver la conexión al pool: con REPEATABLE READ
+                    # el siguiente uso de la conexión vería la misma foto de los datos, y el bloqueo de metadatos
+                    # de la tabla impediría el RENAME y el DROP de `shadow_table`
+                    conn.rollback()
+                    if seconds is not None and self.stats is not None:
+                        self.stats.record(select_query, seconds, rows=streamed)
+        except GeneratorExit:
+            raise
         except Exception as e:
             logging.error(f"Error al seleccionar datos: {str(e)}")
             raise FailConect(f"Ocurrio un error : {str(e)} ")
     
+    def select_dataframe(self, name_table:str, columns : list[str] = None, where : str = None, params:tuple = None,
+                         fetch_size:int = 1000, dtype = None) -> pd.DataFrame:
+        """
+        Selecciona valores de una tabla y los devuelve directamente como DataFrame,
+        construido por bloques a partir de `stream_from_table`.
+
+        Args:
+            name_table (str): Nombre de la tabla de la que se seleccionarán los valores.
+            columns (List[str], optional): Columnas a seleccionar. Defaults to None, todas las columnas.
+            where (str, optional): Condición para filtrar los valores. Defaults to None.
+            params (tuple, optional): Valores para los marcadores %s del where. Defaults to None.
+            fetch_size (int, optional): Cantidad de filas leídas del servidor en cada llamada. Defaults to 1000.
+            dtype (optional): Tipos aplicados al DataFrame con `astype`. Defaults to None.
+
+        Returns:
+            pd.DataFrame: Valores seleccionados, con los nombres de columna de la tabla.
+
+        Raises:
+            FailConect: Error al seleccionar datos.
+        """
+        chunks = list(self.stream_from_table(name_table, columns=columns, where=where, params=params,
+                                             fetch_size=fetch_size, as_dataframe=True, dtype=dtype))
+        if not chunks:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(chunks, ignore_index=True)
+    
     def update_table(self, name_table:str, columns : list[str], values : list[str], where : str = None):
         """
         Actualiza una serie de valores de una tabla determinada, si el where es específico 
         sólo se actualiza la(s) fila(s) que cumplan con el criterio.
         De lo contrario,o en caso el where no sea específicado, se alteran todas las filas con los valores
         señalados.
+        Todas las columnas se actualizan con una sola sentencia UPDATE.
 
         Args:
             table_name (str): Nombre de la tabla en la que se actualizarán los valores.
@@ -227,13 +754,72 @@ class DataBaseMySQL:
             return obj
         
         try:
-            update_query_list = []
-            for column, value in zip(columns, values):
-                update_query = f"UPDATE {name_table} SET {column} = {add_quotes(value)}"
-                if where:
-                    update_query += f" WHERE {where}"
-                update_query_list.append(update_query)
-            self.cursor_execute_command(*update_query_list)
+            assignments = ", ".join(f"{column} = {add_quotes(value)}" for column, value in zip(columns, values))
+            update_query = f"UPDATE {name_table} SET {assignments}"
+            if where:
+                update_query += f" WHERE {where}"
+            self.cursor_execute_command(update_query)
+            self.invalidate_cache(name_table)
+        except Exception as e:
+            logging.error(f"Error al actualizar datos: {str(e)}")
+            raise FailConect(f"Ocurrio un error : {str(e)} ")
+    
+    
+    def bulk_update_table(self, name_table:str, updates, key:str = "ID", batch_size:int = 500, commit:bool = True) -> int:
+        """
+        Actualiza muchas filas identificadas por la columna `key` con una sola sentencia por lote:
+            UPDATE tabla SET col = CASE ID WHEN %s THEN %s ... ELSE col END, ... WHERE ID IN (...)
+        Todos los lotes se ejecutan dentro de una misma transacción. Los valores nulos ('NULL', '', None, etc.)
+        se guardan como NULL, con las mismas reglas que `update_table`.
+
+        Args:
+            name_table (str): Nombre de la tabla en la que se actualizarán los valores.
+            updates (pd.DataFrame or list[tuple[str, dict]]): Dataframe con la columna `key` y las columnas
+                a actualizar, o lista de tuplas (id, {columna: valor}) donde cada fila puede cambiar columnas distintas.
+            key (str, optional): Columna que identifica cada fila. Defaults to "ID".
+            batch_size (int, optional): Cantidad de filas por sentencia UPDATE. Defaults to 500.
+            commit (bool, optional): Si es False no se hace commit, para usarlo dentro de una transacción mayor
+                abierta con `checkout`. Defaults to True.
+
+        Returns:
+            int: Cantidad de filas enviadas a actualizar.
+
+        Raises:
+            FailConect: Error al actualizar datos.
+        """
+        try:
+            if batch_size < 1:
+                raise ValueError("batch_size debe ser mayor a 0")
+            if isinstance(updates, pd.DataFrame):
+                other_columns = [column for column in updates.columns if column != key]
+                key_values = updates[key].tolist()
+                changes_list = [dict(zip(other_columns, row)) for row in self.dataframe_to_rows(updates[other_columns])]
+                updates = list(zip(key_values, changes_list))
+            updates = [(id_row, changes) for id_row, changes in updates if changes]
+            
+            with self.checkout() as conn:
+                for start in range(0, len(updates), batch_size):
+                    batch = updates[start:start + batch_size]
+                    columns = list(dict.fromkeys(column for _, changes in batch for column in changes))
+                    assignments = []
+                    params = []
+                    for column in columns:
+                        cases = []
+                        for id_row, changes in batch:
+                            if column in changes:
+                                value = changes[column]
+                                cases.append("WHEN %s THEN %s")
+                                params += [id_row, None if self.is_null(value) else value]
+                        assignments.append(f"{column} = CASE {key} {' '.join(cases)} ELSE {column} END")
+                    params += [id_row for id_row, _ in batch]
+                    update_query = (f"UPDATE {name_table} SET {', '.join(assignments)} "
+                                    f"WHERE {key} IN ({','.join(['%s'] * len(batch))})")
+                    self.cursor_execute_command(update_query, params=tuple(params), commit=False)
+                if commit:
+                    self.commit(conn)
+            
+            self.invalidate_cache(name_table, keys=[id_row for id_row, _ in updates])
+            return len(updates)
         except Exception as e:
             logging.error(f"Error al actualizar datos: {str(e)}")
             raise FailConect(f"Ocurrio un error : {str(e)} ")
@@ -252,58 +838,410 @@ class DataBaseMySQL:
         try:
             query = f"DELETE FROM {name_table} WHERE {where}"
             self.cursor_execute_command(query)
+            self.invalidate_cache(name_table)
         except Exception as e:
             logging.error(f"Error al eliminar datos: {str(e)}")
             raise FailConect(f"Ocurrio un error : {str(e)} ")
         
     
-    def from_dataframe_create_table(self, name_table:str, df: pd.DataFrame) -> bool:
+    @staticmethod
+    def mysql_errno(error: BaseException) -> int or None:
+        """Devuelve el código del error de MySQL que originó `error`, buscándolo en la cadena de excepciones,
+        o None si no lo originó un error de MySQL."""
+        while error is not None:
+            if isinstance(error, pymysql.err.MySQLError) and error.args and isinstance(error.args[0], int):
+                return error.args[0]
+            error = error.__cause__ or error.__context__
+        return None
+    
+    @staticmethod
+    def is_null(value) -> bool:
+        """Indica si un valor debe guardarse como NULL: None, NaN o una cadena de NULL_VALUES."""
+        if isinstance(value, str):
+            return value in NULL_VALUES
+        return value is None or bool(pd.isna(value))
+    
+    
+    @staticmethod
+    def dataframe_to_rows(df: pd.DataFrame) -> list[tuple]:
+        """Convierte un dataframe en una lista de tuplas lista para insertar,
+        reemplazando los valores nulos ('NULL', '', None, NaN, etc.) por None.
+
+        Args:
+            df (pd.DataFrame): Dataframe a convertir.
+
+        Returns:
+            list[tuple]: Una tupla por fila con valores nativos de Python.
+        """
+        return [tuple(None if DataBaseMySQL.is_null(value) else value for value in row)
+                for row in df.astype(object).values.tolist()]
+    
+    
+    @staticmethod
+    def infer_mysql_type(series: pd.Series, fixed_length:bool = False) -> str:
+        """Deduce el tipo de MySQL más compacto capaz de guardar los valores de una columna.
+        Si en una sincronización posterior un valor no cabe en el tipo, la sesión en modo estricto da error
+        y `sync_dataframe_to_table` crea la tabla nuevamente con los tipos deducidos de los datos nuevos.
+
+        Las columnas de texto (como las generadas por DataGuests, donde todo es str) se analizan por contenido:
+            - Números enteros de hasta 4 dígitos sin ceros a la izquierda -> el entero más pequeño que los contenga,
+              por ejemplo TINYINT UNSIGNED para NUMBER_GUEST. Los números más largos (celulares, códigos)
+              se consideran texto.
+            - Textos de un solo caracter -> CHAR(1), por ejemplo para SEX.
+            - Si `fixed_length` es True, textos de igual longitud de hasta 8 caracteres -> CHAR(n),
+              por ejemplo CHAR(6) para ID.
+            - Otros textos -> VARCHAR(255), o TEXT si superan 255 caracteres.
+
+        Args:
+            series (pd.Series): Columna a evaluar.
+            fixed_length (bool, optional): Si es True la columna es un código de longitud fija, como la llave
+                primaria. Defaults to False.
+
+        Returns:
+            str: Tipo de MySQL, por ejemplo "TINYINT UNSIGNED" o "VARCHAR(255)".
+        """
+        def integer_type(minimum: int, maximum: int) -> str:
+            for name, signed_max, unsigned_max in INTEGER_TYPES:
+                if minimum >= 0 and maximum <= unsigned_max:
+                    return f"{name} UNSIGNED"
+                if minimum >= -signed_max - 1 and maximum <= signed_max:
+                    return name
+            return "DECIMAL(65,0)"
+        
+        values = [value for value in series.tolist() if not DataBaseMySQL.is_null(value)]
+        dtype = str(series.dtype)
+        if dtype == 'bool':
+            return 'BOOLEAN'
+        if dtype.startswith('datetime64'):
+            return 'DATETIME'
+        if dtype.startswith('float'):
+            return 'DOUBLE'
+        if dtype.startswith('int') or dtype.startswith('uint'):
+            return integer_type(int(min(values)), int(max(values))) if values else 'INT'
+        
+        if not values:
+            return 'VARCHAR(255)'
+        values = [str(value) for value in values]
+        if all(re.fullmatch(r"-?(0|[1-9]\d{0,3})", value) for value in values):
+            numbers = [int(value) for value in values]
+            return integer_type(min(numbers), max(numbers))
+        
+        lengths = {len(value) for value in values}
+        max_length = max(lengths)
+        if lengths == {1} or (fixed_length and len(lengths) == 1 and max_length <= 8):
+            return f"CHAR({max_length})"
+        return "VARCHAR(255)" if max_length <= 255 else "TEXT"
+    
+    
+    @staticmethod
+    def dataframe_schema(df: pd.DataFrame, primary_key:str = "ID", indexes:list[str] = None) -> str:
+        """Genera la definición de campos para `create_table` a partir de un dataframe,
+        con tipos deducidos por `infer_mysql_type`, llave primaria e índices secundarios.
+
+        Args:
+            df (pd.DataFrame): Dataframe a partir del cual se deducen los tipos.
+            primary_key (str, optional): Columna declarada como PRIMARY KEY, se ignora si no existe en el dataframe.
+                Defaults to "ID".
+            indexes (list[str], optional): Columnas con índice secundario, por ejemplo ["MESA", "CONFIRMADO"].
+                Defaults to None.
+
+        Returns:
+            str: Definición de campos, por ejemplo "ID CHAR(6) NOT NULL,\nSEX CHAR(1),\nPRIMARY KEY (ID)".
+        """
+        types = {column: DataBaseMySQL.infer_mysql_type(df[column], fixed_length=column == primary_key)
+                 for column in df.columns}
+        
+        fields = []
+        for column, _type in types.items():
+            fields.append(f"{column} {_type} NOT NULL" if column == primary_key else f"{column} {_type}")
+        if primary_key in types:
+            fields.append(f"PRIMARY KEY ({primary_key})")
+        for column in indexes or []:
+            # Las columnas TEXT sólo pueden indexarse por un prefijo
+            prefix = "(64)" if types[column] == "TEXT" else ""
+            fields.append(f"INDEX idx_{column} ({column}{prefix})")
+        return ",\n".join(fields)
+    
+    
+    def from_dataframe_create_table(self, name_table:str, df: pd.DataFrame, batch_size:int = 500,
+                                    primary_key:str = "ID", indexes:list[str] = None, atomic:bool = True) -> bool:
         """Función que permite crear una tabla a partir de un dataframe.
-            Si la tabla ya existe, se eliminará y se creará nuevamente.
+            Si la tabla ya existe, se reemplazará por la nueva. Con `atomic` la nueva tabla se construye aparte
+            con `shadow_table` y se intercambia al final, por lo que la tabla nunca queda vacía ni a medio cargar.
+            Los tipos de cada columna se deducen de los datos con `dataframe_schema` y
+            las filas se insertan por lotes con `bulk_insert_into_table`, o con `load_data_infile` si la conexión
+            tiene `local_infile`. Si el servidor no permite LOAD DATA LOCAL INFILE se vuelve a los INSERT por lotes
+            y no se intenta de nuevo en las siguientes cargas.
         
         Args:
             name_table (str): Nombre de la tabla a crear.
             df (pd.DataFrame): Dataframe a partir del cual se creará la tabla.
+            batch_size (int, optional): Cantidad de filas por sentencia INSERT. Defaults to 500.
+            primary_key (str, optional): Columna declarada como PRIMARY KEY. Defaults to "ID".
+            indexes (list[str], optional): Columnas con índice secundario. Defaults to None.
+            atomic (bool, optional): Si es False la tabla se elimina y se crea directamente, sin tabla auxiliar.
+                Defaults to True.
         
         Raises:
             FailConect: Error al crear tabla.
         """
         try:
-            #Elimina la tabla en caso de existir
-            self.drop_table(name_table)
+            field_columns = self.dataframe_schema(df, primary_key=primary_key, indexes=indexes)
+            with self.shadow_table(name_table) if atomic else contextlib.nullcontext(name_table) as target:
+                #Crea la tabla, eliminándola en caso de existir
+                self.create_table(name_table=target, fields_data=field_columns)
+                #Insertar los valores del dataframe en una tabla
+                loaded = False
+                if self.local_infile:
+                    try:
+                        self.load_data_infile(name_table=target, df=df)
+                        loaded = True
+                    except FailLocalInfile as e:
+                        logging.warning(f"{name_table}: {str(e)}, se insertará por lotes")
+                        self.local_infile = False
+                if not loaded:
+                    self.bulk_insert_into_table(name_table=target, columns=df.columns.tolist(),
+                                                values=self.dataframe_to_rows(df), batch_size=batch_size)
+            
+            #Retornar el resultado de la consulta
+            return True
             
-            # Dtype to MySQL type
-            mysql_types = {'object': 'VARCHAR(255)',
-                       'int64': 'INT',
-                       'float64': 'FLOAT',
-                       'datetime64': 'DATETIME'}
             
-            #Crea una lista con los nombres de la columna y el tipo de datos en mysql
+        except Exception as e:
+            logging.error(f"Error al crear tabla: {str(e)}")
+            raise FailConect(f"Ocurrio un error : {str(e)} ")
+        
+    
+    def get_table_columns(self, name_table:str) -> list[str]:
+        """Devuelve los nombres de las columnas de una tabla en el orden en que fueron creadas.
+
+        Args:
+            name_table (str): Nombre de la tabla a consultar.
+
+        Returns:
+            list[str]: Lista con los nombres de las columnas, vacía si la tabla no existe.
+
+        Raises:
+            FailConect: Error al consultar las columnas.
+        """
+        try:
+            query = f"""SELECT COLUMN_NAME FROM information_schema.COLUMNS
+                        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = '{name_table}'
+                        ORDER BY ORDINAL_POSITION"""
+            return [row[0] for row in self.cursor_execute_command(query)]
+        except Exception as e:
+            logging.error(f"Error al consultar columnas: {str(e)}")
+            raise FailConect(f"Ocurrio un error : {str(e)} ")
+    
+    
+    def sync_dataframe_to_table(self, name_table:str, df: pd.DataFrame, key:str = "ID", batch_size:int = 500,
+                                indexes:list[str] = None) -> dict:
+        """Función que sincroniza una tabla con un dataframe enviando sólo las diferencias.
+            Compara las filas del dataframe con las filas actuales de la tabla usando la columna `key`
+            y ejecuta los INSERT, UPDATE y DELETE necesarios dentro de una sola transacción,
+            de modo que la tabla nunca deja de existir y el costo depende de la cantidad de cambios.
+            Si la tabla no existe o sus columnas no coinciden con las del dataframe,
+            se crea nuevamente con `from_dataframe_create_table`, al igual que si los nuevos valores
+            no caben en los tipos de la tabla actual (por ejemplo un texto más largo que su VARCHAR(n)).
+            Cualquier otro error (conexión perdida, bloqueos, etc.) deshace la transacción y se propaga,
+            sin reconstruir la tabla.
+            Si `key` se repite en el dataframe se conserva la última fila de cada valor, tanto en la sincronización
+            por diferencias como al crear la tabla nuevamente, donde `key` es la llave primaria.
+
+        Args:
+            name_table (str): Nombre de la tabla a sincronizar.
+            df (pd.DataFrame): Dataframe con el contenido actualizado de la tabla.
+            key (str, optional): Columna que identifica de forma única cada fila. Defaults to "ID".
+            batch_size (int, optional): Cantidad de filas por lote enviado. Defaults to 500.
+            indexes (list[str], optional): Índices secundarios usados si la tabla debe crearse nuevamente. Defaults to None.
+
+        Returns:
+            dict: Cantidad de filas insertadas, actualizadas y eliminadas,
+                por ejemplo {"insert": 2, "update": 1, "delete": 0}.
+
+        Raises:
+            FailConect: Error al sincronizar la tabla.
+        """
+        try:
+            duplicated = df[key].duplicated(keep="last")
+            if duplicated.any():
+                logging.warning(f"{name_table}: {key} duplicados {sorted(set(df.loc[duplicated, key]))}, "
+                                f"se conserva la última fila de cada uno")
+                df = df[~duplicated]
             columns = df.columns.tolist()
-            types = df.dtypes.tolist()
-            table= []
-            for column, _type in zip(columns, types):
-                table.append((column, mysql_types[str(_type)]))
+            rebuild = {"insert": len(df), "update": 0, "delete": 0}
+            if self.get_table_columns(name_table) != columns:
+                self.from_dataframe_create_table(name_table=name_table, df=df, batch_size=batch_size,
+                                                 primary_key=key, indexes=indexes)
+                return rebuild
             
-            #Crea el var_field para crear la tabla
-            field_columns=""
-            for columna in table:
-                field_columns += columna[0] + " " + columna[1] + ",\n"
-            field_columns=field_columns[:-2]
+            def normalize(row) -> tuple:
+                """Convierte los valores de una fila a str para comparar el dataframe con la tabla."""
+                return tuple(None if self.is_null(value) else str(value) for value in row)
             
-            #Crea la tabla
-            self.create_table(name_table=name_table, fields_data=field_columns)
-            #Insertar los valores del dataframe en una tabla
-            self.insert_into_table(name_table=name_table, columns=columns, values=df.to_records(index=False))
+            key_index = columns.index(key)
+            current = {row[key_index]: normalize(row) for row in self.select_from_table(name_table=name_table)}
             
-            #Retornar el resultado de la consulta
-            return True
+            new_rows = {row[key_index]: row for row in self.dataframe_to_rows(df)}
+            
+            to_insert = [row for id_row, row in new_rows.items() if id_row not in current]
+            to_update = [(id_row, {column: value for column, value in zip(columns, row) if column != key})
+                         for id_row, row in new_rows.items()
+                         if id_row in current and normalize(row) != current[id_row]]
+            to_delete = [id_row for id_row in current if id_row not in new_rows]
+            
+            insert_query = f"INSERT INTO {name_table} ({','.join(columns)}) VALUES ({','.join(['%s'] * len(columns))})"
+            
+            try:
+                with self.transaction():
+                    for start in range(0, len(to_delete), batch_size):
+                        batch = to_delete[start:start + batch_size]
+                        self.cursor_execute_command(
+                            f"DELETE FROM {name_table} WHERE {key} IN ({','.join(['%s'] * len(batch))})",
+                            params=tuple(batch))
+                    if to_update:
+                        self.bulk_update_table(name_table, to_update, key=key, batch_size=batch_size)
+                    if to_insert:
+                        self.cursor_executemany_command(insert_query, to_insert, batch_size=batch_size)
+            except FailConect as e:
+                if self.mysql_errno(e) not in SCHEMA_ERRORS:
+                    raise
+                logging.warning(f"{name_table}: los cambios no caben en la tabla actual ({str(e)}), se creará nuevamente")
+                to_insert = None
+            if to_insert is None:
+                self.from_dataframe_create_table(name_table=name_table, df=df, batch_size=batch_size,
+                                                 primary_key=key, indexes=indexes)
+                return rebuild
             
+            self.invalidate_cache(name_table, keys=[row[key_index] for row in to_insert]
+                                  + [id_row for id_row, _ in to_update] + to_delete)
+            changes = {"insert": len(to_insert), "update": len(to_update), "delete": len(to_delete)}
+            logging.info(f"{name_table}: sincronizada {changes}")
+            return changes
             
         except Exception as e:
-            logging.error(f"Error al crear tabla: {str(e)}")
+            logging.error(f"Error al sincronizar tabla: {str(e)}")
+            raise FailConect(f"Ocurrio un error : {str(e)} ")
+    
+    
+    def guest_record(self, row: tuple) -> dict:
+        """Convierte una fila de la tabla de invitados en un diccionario con las columnas de GUEST_COLUMNS.
+        Las columnas numéricas (NUMBER_GUEST, MESA) se devuelven como texto, igual que en el excel de invitados.
+
+        Args:
+            row (tuple): Fila con los valores en el orden de GUEST_COLUMNS.
+
+        Returns:
+            dict: Datos del invitado, por ejemplo {"ID": "ABC123", "SEX": "F", ...}.
+        """
+        return dict(zip(self.GUEST_COLUMNS,
+                        [value if value is None or isinstance(value, str) else str(value) for value in row]))
+    
+    
+    def select_guest_json_bytes(self, id:str) -> bytes or None:
+        """
+        Consulta un invitado por su id directamente en la base de datos, sin usar la caché.
+
+        Args:
+            id (str): id de consulta para obtener datos
+
+        Raises:
+            FailConect: Error al consultar la base de datos.
+        Returns:
+            bytes or None: JSON codificado en utf-8 con los datos del invitado, o None si el id no existe.
+        """
+        try:
+            data=self.select_from_table(name_table=self.GUEST_TABLE, columns=self.GUEST_COLUMNS,
+                                        where="ID = %s", params=(id,))
+            if not data:
+                return None
+            return json.dumps(self.guest_record(data[0])).encode("utf-8")
+        except Exception as e:
+            logging.error(f"Error al consultar datos: {str(e)}")
+            raise FailConect(f"Ocurrio un error : {str(e)} ")
+    
+    
+    def consultar_id_json_bytes(self, id:str) -> bytes or None:
+        """
+        Consulta un invitado por su id y devuelve su JSON serializado en bytes, usando la caché si existe.
+        Los ids inexistentes también se guardan en la caché para no repetir la consulta.
+
+        Args:
+            id (str): id de consulta para obtener datos
+
+        Raises:
+            FailConect: Error al consultar la base de datos.
+        Returns:
+            bytes or None: JSON codificado en utf-8 con los datos del invitado, o None si el id no existe.
+        """
+        if self.cache is None:
+            return self.select_guest_json_bytes(id)
+        found, json_bytes = self.cache.get(id)
+        if not found:
+            generation = self.cache.generation()
+            json_bytes = self.select_guest_json_bytes(id)
+            self.cache.set(id, json_bytes, generation=generation)
+        return json_bytes
+    
+    
+    def consultar_ids(self, ids, chunk_size:int = 500, as_json:bool = False) -> tuple[dict, list[str]]:
+        """
+        Consulta varios invitados a la vez con sentencias `WHERE ID IN (...)` de hasta `chunk_size` ids,
+        en lugar de una consulta por id. Si existe caché, los ids que ya están en ella no se consultan
+        y los resultados de la base de datos se guardan en ella.
+
+        Args:
+            ids (iterable[str]): ids a consultar, los repetidos se consultan una sola vez.
+            chunk_size (int, optional): Cantidad máxima de ids por consulta. Defaults to 500.
+            as_json (bool, optional): Si es True los valores del diccionario son el JSON de cada invitado (str),
+                igual al de `consultar_id_and_return_json`. Defaults to False, devolviendo diccionarios.
+
+        Raises:
+            FailConect: Error al consultar la base de datos.
+        Returns:
+            tuple[dict, list[str]]: Diccionario id -> datos del invitado encontrados y lista de ids inexistentes,
+                ambos en el orden en que se recibieron los ids.
+        """
+        try:
+            if chunk_size < 1:
+                raise ValueError("chunk_size debe ser mayor a 0")
+            ids = list(dict.fromkeys(ids))
+            found_bytes = {}
+            pending = []
+            for id in ids:
+                found, json_bytes = self.cache.get(id) if self.cache is not None else (False, None)
+                if found:
+                    found_bytes[id] = json_bytes
+                else:
+                    pending.append(id)
+            
+            records = {}
+            generation = self.cache.generation() if self.cache is not None else None
+            for start in range(0, len(pending), chunk_size):
+                chunk = pending[start:start + chunk_size]
+                data = self.select_from_table(name_table=self.GUEST_TABLE, columns=self.GUEST_COLUMNS,
+                                              where=f"ID IN ({','.join(['%s'] * len(chunk))})", params=tuple(chunk))
+                for row in data:
+                    records[row[0]] = self.guest_record(row)
+            if self.cache is not None:
+                for id in pending:
+                    self.cache.set(id, json.dumps(records[id]).encode("utf-8") if id in records else None,
+                                   generation=generation)
+            
+            result = {}
+            missing = []
+            for id in ids:
+                if id in records:
+                    result[id] = json.dumps(records[id]) if as_json else records[id]
+                elif found_bytes.get(id) is not None:
+                    result[id] = found_bytes[id].decode("utf-8") if as_json else json.loads(found_bytes[id])
+                else:
+                    missing.append(id)
+            return result, missing
+        except Exception as e:
+            logging.error(f"Error al consultar datos: {str(e)}")
             raise FailConect(f"Ocurrio un error : {str(e)} ")
-        
+    
     
     def consultar_id_and_return_json(self,id:str):
         """
@@ -314,15 +1252,12 @@ class DataBaseMySQL:
             id (str): id de consulta para obtener datos
 
         Raises:
-            FailConect: 
+            FailConect: Error al consultar o si el id no existe.
         Returns:
             JSON : json con los datos de la consulta
         """
-        try:
-            data=self.select_from_table(name_table="Lista_de_invitados",where=f"ID='{id}'")
-            result = {"ID": data[0][0], "SEX": data[0][1], "APELLIDOS": data[0][2], "NOMBRES": data[0][3], "NUMBER_GUEST": data[0][4], "MESA": data[0][5], "CELULAR": data[0][6], "CONFIRMADO": data[0][7]}
-            json_data = json.dumps(result)
-            return json_data
-        except Exception as e:
-            logging.error(f"Error al consultar datos: {str(e)}")
-            raise FailConect(f"Ocurrio un error : {str(e)} ")
\ No newline at end of file
+        json_bytes = self.consultar_id_json_bytes(id)
+        if json_bytes is None:
+            logging.error(f"Error al consultar datos: no existe el ID '{id}'")
+            raise FailConect(f"Ocurrio un error : no existe el ID '{id}' ")
+        return json_bytes.decode("utf-8")
@@ -1,9 +1,19 @@
 import pandas as pd
 import numpy as np
 import openpyxl
-import xlrd
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC, MergedCell
+from openpyxl.cell.read_only import EmptyCell
+from pandas.io.parsers import TextParser
 import os
+import re
+import glob
+import hashlib
+import tempfile
 import logging
+import math
+import time
+import concurrent.futures
 from Class.CloseWs import CloseWs
 
 
@@ -14,24 +24,73 @@ class FailDataExcel(Exception):
     def __str__(self):
         return self.msg
 
+
+class RowError(str):
+    """
+    Resultado de una fila cuya función lanzó una excepción en `DataExcel.map_rows(capture_errors=True)`.
+    Es un str con el tipo y el mensaje del error, para que se pueda guardar en Excel junto a los demás resultados.
+
+    Atributos:
+        index (int): Posición de la fila en el dataframe.
+    """
+    def __new__(cls, index:int, error:Exception):
+        row_error = super().__new__(cls, f"{error.__class__.__name__}: {error}")
+        row_error.index = index
+        return row_error
+    
+    def __reduce__(self):
+        # Permite devolver el error desde un proceso hijo en el modo "process"
+        return (RowError._from_text, (self.index, str(self)))
+    
+    @classmethod
+    def _from_text(cls, index:int, text:str):
+        row_error = str.__new__(cls, text)
+        row_error.index = index
+        return row_error
+
+
+def _apply_to_chunk(func, start:int, rows, capture_errors:bool) -> list:
+    """Aplica `func` a cada fila de un bloque. Está fuera de la clase para poder enviarse a otro proceso."""
+    results = []
+    for offset, row in enumerate(rows):
+        try:
+            results.append(func(*row))
+        except Exception as e:
+            if not capture_errors:
+                raise
+            results.append(RowError(start + offset, e))
+    return results
+
 class DataExcel:
     """
     La clase `DataExcel` se encarga de gestionar la carga de un archivo de Excel en formato .xls o .xlsx.
     Los archivos de excel trabajados serán transformados todos a formato texto para evitar errores de tipo de dato.
     Los dataframes generados por esta clase serán de tipo `pandas.DataFrame` pero con dtype `object` en todas las columnas.
 
+    Los DataFrames cargados se guardan en una caché en formato Feather dentro de la carpeta `.cache` junto al
+    archivo, identificada por el hash del contenido del archivo y las opciones de carga. Mientras el archivo
+    no cambie, las siguientes cargas leen la caché (mapeada en memoria) en lugar de volver a leer el Excel.
+    La caché requiere pyarrow; si no está instalado, los archivos se leen siempre desde el Excel.
+
     Atributos:
         path (str): Ruta del archivo Excel a cargar.
         header (str): Nombre de la cabecera a utilizar para identificar el inicio de los datos en el archivo.
+        use_cache (bool): Indica si se usa la caché de DataFrames.
         _frame (DataFrame): DataFrame resultante de cargar los datos del archivo.
 
     Métodos:
         path_verify() -> Verifica la ruta del archivo y la transforma a formato .xlsx en caso de ser necesario.
-        load_excel() -> Carga los datos del archivo a un DataFrame.
+        load_excel() -> Carga los datos del archivo a un DataFrame, desde la caché si el archivo no cambió.
+        parse_excel() -> Lee los datos del archivo a un DataFrame sin usar la caché.
         transform_xlsx_values_to_text(file_path:str) -> Transforma los valores de todas las celdas de un archivo .xlsx a formato de texto.
         transform_xls_to_xlsx(file_path:str) -> Transforma un archivo .xls a .xlsx y transforma los valores de todas las celdas a formato de texto.
+        apply_function_to_rows(func) -> Aplica una función a cada fila del DataFrame y agrega los resultados en una columna.
+        map_rows(func, rows) -> Aplica una función a cada fila en serie, en un pool de hilos o en un pool de procesos.
     """
-    def __init__(self, path:str, header:str = None, dtype_str:bool = False):
+    CACHE_VERSION = 1
+    MAX_CACHE_ENTRIES = 32
+    
+    def __init__(self, path:str, header:str = None, dtype_str:bool = False, use_cache:bool = True):
         """
          Inicializa la clase `DataExcel`.
 
@@ -40,8 +99,11 @@ class DataExcel:
             header (str, opcional): Nombre de la cabecera a utilizar para identificar el inicio de los datos en el archivo. Por defecto, None.
             dtype_str(bool, opcional): Especifica si se quiere que todo el dataframe se lea como celdas con formato string. Por defecto, False,
                 lo que indica que deja que el establecimientos de dtypes dependerá de pd.read_excel().
+            use_cache(bool, opcional): Especifica si se usa la caché de DataFrames en la carpeta `.cache`. Por defecto, True.
         """
         self._path=path
+        self.use_cache=use_cache
+        self._hashes={}
         self.path=self.path_verify()
         self.header=header
         self.dtype_str= dtype_str
@@ -75,6 +137,8 @@ class DataExcel:
             path=self._path
             
             if path.endswith(".xls"):
+                # xlrd sólo se necesita para los archivos .xls, por eso se importa aquí
+                import xlrd
                 try:
                     path_xlsx=path.replace(".xls",".xlsx")
                     DataExcel.transform_xls_to_xlsx(path)
@@ -89,7 +153,11 @@ class DataExcel:
                     return path_xlsx
             
             elif path.endswith(".xlsx"):
-                DataExcel.transform_xlsx_values_to_text(path)
+                # Si el contenido ya se normalizó antes, no es necesario volver a leer el archivo
+                if not (self.use_cache and os.path.exists(self.cache_file(path, ".normalized"))):
+                    DataExcel.transform_xlsx_values_to_text(path)
+                    if self.use_cache:
+                        self.write_cache_marker(path)
                 return path
             
             else:
@@ -104,10 +172,36 @@ class DataExcel:
                     
     
     def load_excel(self):
+        """
+        Método que carga los datos del archivo xlsx y retorna un DataFrame, igual que `parse_excel`.
+        Si existe una caché para el contenido actual del archivo y las mismas opciones de carga, el DataFrame
+        se lee desde ella; de lo contrario se lee el Excel y se guarda en la caché para la siguiente carga.
+
+        Returns:
+            pandas.DataFrame: El DataFrame generado a partir del archivo de Excel.
+
+        Raises:
+            FailDataExcel: Si se presenta algún error durante la carga de los datos.
+        """
+        if not self.use_cache:
+            return self.parse_excel()
+        frame = self.read_cache()
+        if frame is None:
+            frame = self.parse_excel()
+            self.write_cache(frame)
+        return frame
+    
+    
+    def parse_excel(self):
         """
         Método que carga los datos del archivo xlsx y retorna un DataFrame con todas las columnas de tipo `object`
         en caso el argumento dtype_str tenga valor True al inicializar el objeto DataExcel.
         Por defecto Pandas interpretará el tipo de dato en cada columna
+        
+        El archivo se lee una sola vez con openpyxl en modo de sólo lectura: mientras se recorren las filas
+        se busca la fila que contiene `header` y se descartan las anteriores. Las filas restantes se convierten
+        con el mismo parser que usa pd.read_excel, por lo que el resultado es idéntico al de leer el archivo
+        con pd.read_excel(header=fila_de_cabecera).
 
         Returns:
             pandas.DataFrame: El DataFrame generado a partir del archivo de Excel.
@@ -117,25 +211,332 @@ class DataExcel:
         """
         read_as_string = str if self.dtype_str is True else None
         try:
+            wb = openpyxl.load_workbook(self.path, read_only=True, data_only=True)
+            try:
+                sheet = wb.worksheets[0]
+                sheet.reset_dimensions()
+                data = []
+                header_found = self.header is None
+                last_row_with_data = -1
+                for row in sheet.iter_rows():
+                    converted_row = [DataExcel._convert_cell(cell) for cell in row]
+                    while converted_row and converted_row[-1] == "":
+                        converted_row.pop()
+                    if not header_found and self.header in converted_row:
+                        # Las filas anteriores a la cabecera no forman parte de los datos
+                        header_found = True
+                        data = []
+                        last_row_with_data = -1
+                    if converted_row:
+                        last_row_with_data = len(data)
+                    data.append(converted_row)
+            finally:
+                wb.close()
             
-            frame=pd.read_excel(self.path, header=None, dtype=read_as_string)
-            if self.header is not None:
-                head=frame[frame.eq(self.header).any(axis=1, bool_only=None)].index.values
-                if head.size > 0:
-                    return pd.read_excel(self.path, header=head[0], dtype=read_as_string)
+            # Se eliminan las filas vacías finales y se completan las filas al mismo ancho, igual que pd.read_excel
+            data = data[: last_row_with_data + 1]
+            if not data:
+                return pd.DataFrame()
+            max_width = max(len(data_row) for data_row in data)
+            data = [data_row + [""] * (max_width - len(data_row)) for data_row in data]
             
-            return pd.read_excel(self.path, dtype=read_as_string)
+            with TextParser(data, header=0, dtype=read_as_string) as parser:
+                return parser.read()
         
         except Exception as e:
-            logging.error("DataExcel : Problema al ejecutar load_excel()")
+            logging.error("DataExcel : Problema al ejecutar parse_excel()")
             logging.error(f"{e.__class__}: {e}")
-            raise FailDataExcel(f"Error al ejecutar load_excel(): {e.__class__}: {e}")
+            raise FailDataExcel(f"Error al ejecutar parse_excel(): {e.__class__}: {e}")
+    
+    
+    def file_hash(self, file_path:str) -> str:
+        """
+        Calcula el hash sha256 del contenido de un archivo. El resultado se recuerda mientras el archivo
+        no cambie de tamaño ni de fecha de modificación, para no volver a leerlo.
+
+        Args:
+            file_path (str): Ruta del archivo.
+
+        Returns:
+            str: Hash sha256 en hexadecimal.
+        """
+        stat = os.stat(file_path)
+        key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+        if key not in self._hashes:
+            digest = hashlib.sha256()
+            with open(file_path, "rb") as file:
+                for block in iter(lambda: file.read(1 << 20), b""):
+                    digest.update(block)
+            self._hashes[key] = digest.hexdigest()
+        return self._hashes[key]
+    
+    
+    def cache_file(self, file_path:str, suffix:str) -> str:
+        """
+        Devuelve la ruta de una entrada de la caché para el contenido actual de un archivo, con la forma
+        `.cache/<nombre>-<hash>-<sufijo>`.
+
+        Args:
+            file_path (str): Ruta del archivo de Excel.
+            suffix (str): Sufijo de la entrada, por ejemplo ".normalized" o "-<opciones>.feather".
+
+        Returns:
+            str: Ruta de la entrada de la caché.
+        """
+        folder = os.path.join(os.path.dirname(os.path.abspath(file_path)), ".cache")
+        stem = os.path.splitext(os.path.basename(file_path))[0]
+        return os.path.join(folder, f"{stem}-{self.file_hash(file_path)[:16]}{suffix}")
+    
+    
+    def frame_cache_file(self) -> str:
+        """Devuelve la ruta del DataFrame en caché para el archivo actual y las opciones de carga."""
+        options = repr((self.header, self.dtype_str, DataExcel.CACHE_VERSION, pd.__version__))
+        return self.cache_file(self.path, f"-{hashlib.sha256(options.encode()).hexdigest()[:8]}.feather")
+    
+    
+    def read_cache(self) -> pd.DataFrame or None:
+        """
+        Lee el DataFrame en caché del archivo actual mapeando el archivo Feather en memoria.
+
+        Returns:
+            pandas.DataFrame or None: El DataFrame en caché, o None si no existe o no se puede leer.
+        """
+        try:
+            cache_path = self.frame_cache_file()
+            if not os.path.exists(cache_path):
+                return None
+            import pyarrow.feather
+            frame = pyarrow.feather.read_table(cache_path, memory_map=True).to_pandas()
+            # Las celdas vacías de las columnas de texto se devuelven como NaN, igual que pd.read_excel
+            for column in frame.columns[frame.dtypes == object]:
+                frame[column] = frame[column].where(frame[column].notna(), np.nan)
+            os.utime(cache_path)
+            return frame
+        except Exception as e:
+            logging.warning(f"DataExcel : No se pudo leer la caché de {self.path}: {e.__class__}: {e}")
+            return None
+    
+    
+    def write_cache(self, frame:pd.DataFrame) -> bool:
+        """
+        Guarda un DataFrame en la caché del archivo actual en formato Feather y elimina las entradas antiguas.
+        Los DataFrames que Feather no puede representar (por ejemplo columnas con tipos mezclados) no se guardan.
+
+        Args:
+            frame (pandas.DataFrame): DataFrame cargado desde el archivo actual.
+
+        Returns:
+            bool: True si el DataFrame se guardó en la caché.
+        """
+        try:
+            import pyarrow.feather
+            cache_path = self.frame_cache_file()
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            temp_path = f"{cache_path}.tmp"
+            pyarrow.feather.write_feather(frame, temp_path)
+            os.replace(temp_path, cache_path)
+            self.evict_cache(self.path)
+            return True
+        except Exception as e:
+            logging.warning(f"DataExcel : No se pudo guardar la caché de {self.path}: {e.__class__}: {e}")
+            if "temp_path" in locals() and os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+    
+    
+    def write_cache_marker(self, file_path:str) -> None:
+        """Registra en la caché que el contenido actual del archivo ya está normalizado a texto."""
+        try:
+            marker = self.cache_file(file_path, ".normalized")
+            os.makedirs(os.path.dirname(marker), exist_ok=True)
+            open(marker, "w").close()
+            self.evict_cache(file_path)
+        except Exception as e:
+            logging.warning(f"DataExcel : No se pudo guardar la caché de {file_path}: {e.__class__}: {e}")
+    
+    
+    def evict_cache(self, file_path:str) -> None:
+        """
+        Elimina de la caché las entradas de versiones anteriores del archivo y, si la carpeta supera
+        MAX_CACHE_ENTRIES entradas, las usadas hace más tiempo.
+
+        Args:
+            file_path (str): Ruta del archivo de Excel cuyas entradas actuales se conservan.
+        """
+        current = os.path.basename(self.cache_file(file_path, ""))
+        folder = os.path.join(os.path.dirname(os.path.abspath(file_path)), ".cache")
+        stem = os.path.splitext(os.path.basename(file_path))[0]
+        for entry in glob.glob(os.path.join(glob.escape(folder), f"{glob.escape(stem)}-*")):
+            # <nombre>-<hash de 16 caracteres><sufijo>: se eliminan las de otro hash
+            match = re.fullmatch(re.escape(stem) + r"-([0-9a-f]{16})([.-].*)", os.path.basename(entry))
+            if match and match.group(1) != current[len(stem) + 1:] and not entry.endswith(".tmp"):
+                os.remove(entry)
+        entries = sorted(glob.glob(os.path.join(glob.escape(folder), "*")), key=os.path.getmtime)
+        for entry in entries[:max(0, len(entries) - DataExcel.MAX_CACHE_ENTRIES)]:
+            os.remove(entry)
+        
+    
+    def apply_function_to_rows(self, func, mode:str = "serial", max_workers:int = None, chunk_size:int = None,
+                               capture_errors:bool = False, progress=None, column:str = None) -> pd.DataFrame:
+        """
+        Toma una función y la aplica a cada fila del dataframe. El resultado de la función se agrega en una nueva columna
+        al final del dataframe con el nombre de la función como header. Ver `map_rows` para los modos de ejecución.
+        
+        Args:
+            func (callable): Función a aplicar a cada fila del DataFrame; recibe los valores de la fila como argumentos.
+            mode (str, opcional): "serial", "thread" o "process". Por defecto, "serial".
+            max_workers (int, opcional): Hilos o procesos a usar. Por defecto, el valor de concurrent.futures.
+            chunk_size (int, opcional): Filas por bloque. Por defecto, se calcula según el modo.
+            capture_errors (bool, opcional): Si es True, las filas que fallan devuelven un RowError en lugar de
+                detener la ejecución. Por defecto, False.
+            progress (callable, opcional): Función progress(hechas, total, filas_por_segundo) llamada al terminar
+                cada bloque. Por defecto, None.
+            column (str, opcional): Nombre de la columna de resultados. Por defecto, el nombre de la función.
+            
+        Returns:
+            pandas.DataFrame: Dataframe original con una nueva columna que contiene los resultados de la función.
+        """
+        results = self.map_rows(func, self._frame.values, mode=mode, max_workers=max_workers, chunk_size=chunk_size,
+                                capture_errors=capture_errors, progress=progress)
+        self._frame[column or getattr(func, "__name__", "resultado")] = results
+        return self._frame
+    
+    
+    @staticmethod
+    def map_rows(func, rows, mode:str = "serial", max_workers:int = None, chunk_size:int = None,
+                 capture_errors:bool = False, progress=None) -> list:
+        """
+        Aplica `func(*fila)` a cada fila y devuelve los resultados en el orden de las filas.
+        
+        Las filas se reparten en bloques de `chunk_size` filas:
+            "serial": Los bloques se ejecutan uno tras otro en el hilo actual.
+            "thread": Cada bloque se ejecuta en un pool de hilos; sirve para funciones que esperan E/S (envíos, APIs).
+                Por defecto los bloques son de una fila, para que una fila lenta no retrase a las demás.
+            "process": Cada bloque se ejecuta en un pool de procesos; sirve para funciones que usan CPU. La función
+                y las filas deben poder serializarse con pickle (por ejemplo, funciones de módulo o métodos estáticos).
+                Por defecto se usan unos cuatro bloques por proceso, para repartir la carga sin enviar fila por fila.
+        
+        Args:
+            func (callable): Función a aplicar a cada fila; recibe los valores de la fila como argumentos.
+            rows (iterable): Filas, por ejemplo `dataframe.values`.
+            mode (str, opcional): "serial", "thread" o "process". Por defecto, "serial".
+            max_workers (int, opcional): Hilos o procesos a usar. Por defecto, el valor de concurrent.futures.
+            chunk_size (int, opcional): Filas por bloque. Por defecto, se calcula según el modo.
+            capture_errors (bool, opcional): Si es True, las filas que fallan devuelven un RowError en lugar de
+                detener la ejecución. Por defecto, False.
+            progress (callable, opcional): Función progress(hechas, total, filas_por_segundo) llamada desde el hilo
+                actual al terminar cada bloque. Por defecto, None.
+        
+        Returns:
+            list: Resultado de cada fila, en el orden original.
+        
+        Raises:
+            ValueError: Si `mode` no es válido.
+            Exception: La excepción de la primera fila que falle, si `capture_errors` es False.
+        """
+        if mode not in ("serial", "thread", "process"):
+            raise ValueError(f"Modo inválido: {mode}. Los modos válidos son 'serial', 'thread' y 'process'")
+        rows = list(rows)
+        total = len(rows)
+        if chunk_size is None:
+            if mode == "thread":
+                chunk_size = 1
+            elif mode == "process":
+                workers = max_workers or os.cpu_count() or 1
+                chunk_size = math.ceil(total / (workers * 4))
+            else:
+                # En serie los bloques sólo definen cada cuánto se informa el avance
+                chunk_size = math.ceil(total / 100)
+        chunk_size = max(1, chunk_size)
+        starts = range(0, total, chunk_size)
+        
+        start_time = time.perf_counter()
+        done = 0
+        def report(count):
+            nonlocal done
+            done += count
+            if progress is not None:
+                elapsed = time.perf_counter() - start_time
+                progress(done, total, done / elapsed if elapsed > 0 else 0.0)
         
+        if mode == "serial":
+            results = []
+            for start in starts:
+                chunk = _apply_to_chunk(func, start, rows[start:start + chunk_size], capture_errors)
+                results.extend(chunk)
+                report(len(chunk))
+            return results
+        
+        executor_class = (concurrent.futures.ThreadPoolExecutor if mode == "thread"
+                          else concurrent.futures.ProcessPoolExecutor)
+        chunks = [None] * len(starts)
+        with executor_class(max_workers=max_workers) as executor:
+            futures = {executor.submit(_apply_to_chunk, func, start, rows[start:start + chunk_size], capture_errors): n
+                       for n, start in enumerate(starts)}
+            try:
+                for future in concurrent.futures.as_completed(futures):
+                    chunks[futures[future]] = future.result()
+                    report(len(chunks[futures[future]]))
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        return [result for chunk in chunks for result in chunk]
+    
+    
+    @staticmethod
+    def _convert_cell(cell):
+        """Convierte el valor de una celda de openpyxl de la misma forma que pd.read_excel:
+        celdas vacías a "", errores a NaN y números enteros guardados como float a int."""
+        if cell.value is None:
+            return ""
+        if cell.data_type == TYPE_ERROR:
+            return np.nan
+        if cell.data_type == TYPE_NUMERIC:
+            value = int(cell.value)
+            if value == cell.value:
+                return value
+            return float(cell.value)
+        return cell.value
+    
+    
+    @staticmethod
+    def is_xlsx_text_normalized(file_path) -> bool:
+        """
+        Verifica, leyendo el archivo en modo de sólo lectura, si la hoja activa de un archivo .xlsx ya tiene
+        todas sus celdas como texto con formato "@", es decir, si ya pasó por `transform_xlsx_values_to_text`.
+        La lectura se detiene en la primera celda que no cumple la condición.
+
+        Args:
+            file_path (str): Ruta del archivo .xlsx a verificar.
+
+        Returns:
+            bool: True si todas las celdas ya están en formato texto.
+        """
+        wb = openpyxl.load_workbook(file_path, read_only=True)
+        try:
+            sheet = wb.active
+            # Muchos programas escriben mal la etiqueta <dimension>; sin esto la lectura se cortaría antes
+            sheet.reset_dimensions()
+            for row in sheet.iter_rows():
+                for cell in row:
+                    if isinstance(cell, EmptyCell):
+                        continue
+                    if cell.number_format != "@" or not (cell.value is None or isinstance(cell.value, str)):
+                        return False
+            return True
+        finally:
+            wb.close()
     
     @staticmethod
     def transform_xlsx_values_to_text(file_path):
         """
-        Transforma los valores de todas las celdas de un archivo .xlsx a formato de texto.
+        Transforma los valores de todas las celdas de la hoja activa de un archivo .xlsx a formato de texto.
+        
+        Sólo cambian los valores y el formato de número de la hoja activa; los estilos, anchos de columna,
+        celdas combinadas y las demás hojas se mantienen. El libro modificado se guarda en un archivo temporal
+        que luego reemplaza al original, para que una lectura concurrente nunca vea un archivo a medio escribir.
+        Si el archivo ya está en formato texto no se vuelve a abrir para escritura.
 
         Args:
             file_path (str): Ruta del archivo .xlsx a transformar.
@@ -146,24 +547,36 @@ class DataExcel:
         Raises:
             FailDataExcel: Si se presenta algún error durante la transformación.
         """
+        if DataExcel.is_xlsx_text_normalized(file_path):
+            return True
+        
         wb = openpyxl.load_workbook(file_path)
-        sheet=wb.active
-        
-        for row in sheet.iter_rows():
-            for cell in row:
-                if cell.value is None:
-                    cell.value=""
-                else:
-                    cell.value = str(cell.value)
-                cell.number_format = "@"
-        wb.save(file_path)
-        wb.close()
+        fd, temp_path = tempfile.mkstemp(suffix=".xlsx", dir=os.path.dirname(os.path.abspath(file_path)))
+        os.close(fd)
+        try:
+            sheet = wb.active
+            for row in sheet.iter_rows():
+                for cell in row:
+                    # Las celdas cubiertas por una combinación no tienen valor propio, sólo formato
+                    if not isinstance(cell, MergedCell):
+                        cell.value = "" if cell.value is None else str(cell.value)
+                    cell.number_format = "@"
+            wb.save(temp_path)
+            wb.close()
+            os.replace(temp_path, file_path)
+        except Exception:
+            wb.close()
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
         return True
     
     @staticmethod
     def transform_xls_to_xlsx(file_path):
         """
         Transforma un archivo .xls a .xlsx y transforma los valores de todas las celdas a formato de texto.
+        Se convierten todas las hojas del archivo, leyendo cada fila completa con xlrd y agregándola
+        a un libro de openpyxl en modo de sólo escritura, hoja por hoja.
 
         Args:
             file_path (str): Ruta del archivo .xls a transformar.
@@ -174,27 +587,28 @@ class DataExcel:
         Raises:
             FailDataExcel: Si se presenta algún error durante la transformación.
         """
-        wb=xlrd.open_workbook(file_path)
-        wb_xlsx = openpyxl.Workbook()
+        import xlrd
+        wb=xlrd.open_workbook(file_path, on_demand=True)
+        wb_xlsx = openpyxl.Workbook(write_only=True)
         path_xlsx=file_path.replace(".xls",".xlsx")
         
-        sh = wb.sheet_by_index(0)
-        sh_destino = wb_xlsx.active
-        
-        for r in range(sh.nrows):
-            for c in range(sh.ncols):
-                valor=sh.cell_value(r,c)
-                if valor is None:
-                    sh_destino.cell(row=r+1, column=c+1).value = ""
-                else:
-                    sh_destino.cell(row=r+1, column=c+1).value = str(valor)
-                sh_destino.cell(row=r+1, column=c+1).number_format = "@"
-        
-        if os.path.exists(path_xlsx):
-            os.remove(path_xlsx)                
-        
-        wb_xlsx.save(path_xlsx)
-        wb_xlsx.close()
-        wb.close()
+        try:
+            for sheet_index in range(wb.nsheets):
+                sh = wb.sheet_by_index(sheet_index)
+                sh_destino = wb_xlsx.create_sheet(title=sh.name)
+                for r in range(sh.nrows):
+                    new_row = []
+                    for valor in sh.row_values(r):
+                        text_cell = WriteOnlyCell(sh_destino, value="" if valor is None else str(valor))
+                        text_cell.number_format = "@"
+                        new_row.append(text_cell)
+                    sh_destino.append(new_row)
+                wb.unload_sheet(sheet_index)
+            
+            if os.path.exists(path_xlsx):
+                os.remove(path_xlsx)
+            wb_xlsx.save(path_xlsx)
+        finally:
+            wb.release_resources()
         os.remove(file_path)
-        return True
\ No newline at end of file
+        return True
@@ -1,16 +1,41 @@
 import pandas as pd
+import numpy as np
 import openpyxl
 import os
-import random
+import logging
 import string
-from Class.DataExcel import DataExcel
+import tempfile
+import threading
+from Class.DataExcel import DataExcel, FailDataExcel
 
 class DataGuests(DataExcel):
     
-    def __init__(self):
+    ID_ALPHABET = np.array(list(string.ascii_uppercase + string.digits))
+    ID_LENGTH = 6
+    NULL_TEXTS = ["", "NONE", "NULL", "NAN"]
+    
+    def __init__(self, db=None, persist:bool = True, background:bool = True, use_cache:bool = True):
+        """
+        Carga el archivo de invitados y completa los ID's vacíos.
+
+        Args:
+            db (DataBaseMySQL, opcional): Base de datos cuyos ID's de la tabla de invitados también se evitan
+                al generar ID's nuevos. Por defecto, None.
+            persist (bool, opcional): Si es True y la carga cambió algún valor (ID's nuevos o mayúsculas),
+                los cambios se guardan en el archivo de invitados. Por defecto, True.
+            background (bool, opcional): Si es True el archivo se guarda en un hilo aparte; antes de usar los
+                ID's generados hay que esperar a que termine con `wait_saved`, que lanza el error si el guardado
+                falló. Por defecto, True.
+            use_cache (bool, opcional): Especifica si se usa la caché de DataFrames en la carpeta `.cache`. Por defecto, True.
+        """
         self._path=self.find_path_guest_file()
-        super().__init__(path=self._path,header="ID")
+        super().__init__(path=self._path,header="ID",dtype_str=True,use_cache=use_cache)
         self.save_path= self._path
+        self.db=db
+        self.persist=persist
+        self.background=background
+        self._save_thread=None
+        self._save_error=None
         self._frame=self.reload_excel()
         
     
@@ -40,75 +65,139 @@ class DataGuests(DataExcel):
     
 
     
-    def reload_excel(self)-> pd.DataFrame:
-        """Función que actualiza el archivo de invitados con ID's aleatorios en caso de que estén vacíos.
-        Guarda los cambios en el archivo fuente y devuelve el dataframe actualizado con todas las celdas en formato str. 
+    @staticmethod
+    def generate_ids(count:int, taken:set, length:int = 6, rng:np.random.Generator = None) -> list[str]:
+        """
+        Genera `count` ID's alfanuméricos en mayúsculas, distintos entre sí y distintos a los de `taken`.
+        Los ID's se generan en bloque con numpy y se verifican contra un set, por lo que el costo es
+        proporcional a la cantidad de ID's y no al tamaño de la lista de invitados.
+
+        Args:
+            count (int): Cantidad de ID's a generar.
+            taken (set): ID's que ya están en uso. Se le agregan los ID's generados.
+            length (int, optional): Cantidad de caracteres de cada ID. Defaults to 6.
+            rng (np.random.Generator, optional): Generador de números aleatorios. Defaults to None, uno nuevo.
+
+        Returns:
+            list[str]: Lista de ID's nuevos.
+
+        Raises:
+            ValueError: Si no quedan suficientes ID's disponibles.
+        """
+        alphabet = DataGuests.ID_ALPHABET
+        if count > len(alphabet) ** length - len(taken):
+            raise ValueError(f"No hay suficientes ID's de {length} caracteres disponibles para {count} invitados")
+        rng = rng if rng is not None else np.random.default_rng()
+        new_ids = []
+        while len(new_ids) < count:
+            codes = alphabet[rng.integers(0, len(alphabet), size=(count - len(new_ids), length))]
+            # Cada fila de caracteres se interpreta como un solo string de `length` caracteres
+            for new_id in codes.view(f"<U{length}").ravel().tolist():
+                if new_id not in taken:
+                    taken.add(new_id)
+                    new_ids.append(new_id)
+        return new_ids
+    
+    def ids_in_database(self) -> set:
+        """
+        Devuelve los ID's de la tabla de invitados de la base de datos `db`, si fue especificada.
 
+        Returns:
+            set: ID's existentes en la base de datos, vacío si no hay base de datos o tabla.
+        """
+        if self.db is None or not self.db.get_table_columns(self.db.GUEST_TABLE):
+            return set()
+        return {row[0] for row in self.db.select_from_table(name_table=self.db.GUEST_TABLE, columns=["ID"])}
+    
+    def reload_excel(self)-> pd.DataFrame:
+        """Función que completa los ID's vacíos del archivo de invitados con ID's aleatorios y pasa el texto a mayúsculas.
+        Devuelve el dataframe actualizado con todas las celdas en formato str y "NULL" en las celdas vacías.
+        Si `persist` es True y cambió algún valor, los cambios se guardan en el archivo fuente (ver `save_excel`).
 
         Returns:
             pd.DataFrame: Dataframe actualizado.
+
+        Raises:
+            FailDataExcel: Si el guardado sin hilo aparte (`background` False) falla.
         """
         
         dataframe=self.load_excel()
-        dataframe=dataframe.dropna(subset=["APELLIDOS"])
-        dataframe=dataframe.fillna("")
         
-        def generate_id(cell_value:str)-> str:
-            """Función que devuelve un ID de 6 caracteres alfanuméricos.
-
-            Args:
-                cell_value (str): ID por defecto de la celda, se modifica si está vacío.
-
-            Returns:
-                str: Nuevo ID en caso la celda esté vacía, o el ID por defecto de la celda.
-            """
-            
-            if cell_value == "":
-                while True:
-                    new_id="".join(random.choices(string.ascii_uppercase + string.digits, k=6))
-                    if new_id not in dataframe["ID"].values:
-                        return new_id
-            else:
-                return cell_value
-            
+        #Mayúsculas columna por columna; todas las celdas son str o NaN porque el archivo se carga como texto
+        changed = False
+        for column in dataframe.columns:
+            values = dataframe[column]
+            upper = values.str.upper()
+            changed = changed or bool((values.notna() & (upper != values)).any())
+            dataframe[column] = upper
+        
+        #Celdas vacías o con texto nulo a "NULL" en una sola pasada
+        dataframe = dataframe.mask(dataframe.isna() | dataframe.isin(self.NULL_TEXTS), "NULL")
+        #Se descartan las filas sin apellidos después de normalizar los nulos, para que una fila con "none" no
+        #se conserve al cargar y se pierda al guardar (se guarda vacía), y cargar y guardar den el mismo resultado
+        dataframe = dataframe[dataframe["APELLIDOS"] != "NULL"].reset_index(drop=True)
+        
+        #Genera ID's para las celdas vacías, evitando los ID's existentes en el archivo y en la base de datos
+        empty_ids = (dataframe["ID"] == "NULL") | (dataframe["ID"].str.strip() == "")
+        existing_ids = dataframe.loc[~empty_ids, "ID"]
+        if existing_ids.duplicated().any():
+            logging.warning(f"DataGuests : ID's repetidos en el archivo: {sorted(set(existing_ids[existing_ids.duplicated()]))}")
+        taken = set(existing_ids) | self.ids_in_database()
+        dataframe.loc[empty_ids, "ID"] = self.generate_ids(int(empty_ids.sum()), taken, length=self.ID_LENGTH)
+        changed = changed or bool(empty_ids.any())
         
-        dataframe["ID"]=dataframe["ID"].apply(generate_id)
-        dataframe = dataframe.applymap(lambda s: s.upper() if type(s) == str else s)
-        dataframe.to_excel(self.save_path,index=False)
-        dataframe=pd.read_excel(self.save_path,dtype=str)
-        dataframe=dataframe.fillna("NULL")
-        dataframe=dataframe.replace("","NULL")
-        dataframe=dataframe.replace("none","NULL")
-        dataframe=dataframe.replace("None","NULL")
+        if self.persist and changed:
+            if self.background:
+                self.wait_saved()
+                self._save_thread = threading.Thread(target=self.save_excel, args=(dataframe.copy(),),
+                                                     name="guest-save")
+                self._save_thread.start()
+            else:
+                self.save_excel(dataframe)
+                self.wait_saved()
         return dataframe
     
-    
-    
-    def apply_function_to_rows(self, func):
+    def save_excel(self, dataframe:pd.DataFrame) -> bool:
         """
-        
-        Toma una función y la aplica a cada fila del dataframe. El resultado de la función se agrega en una nueva columna
-        al final del dataframe con el nombre de la función como header.
-        
+        Guarda el dataframe en el archivo de invitados, con las celdas "NULL" vacías y en formato de texto.
+        El archivo se escribe en un temporal que luego reemplaza al original, para que una lectura concurrente
+        nunca vea un archivo a medio escribir, y se registra como normalizado para no volver a transformarlo.
+
         Args:
-            func (callable): Función a aplicar a cada fila del DataFrame.
-            
+            dataframe (pd.DataFrame): Dataframe devuelto por `reload_excel`.
+
         Returns:
-            pandas.DataFrame: Dataframe original con una nueva columna que contiene los resultados de la función.
+            bool: True si el archivo se guarda con éxito, False en caso contrario; el error queda guardado
+                y lo lanza `wait_saved`.
         """
-        # Convertimos el DataFrame a un array de numpy para mejorar la velocidad
-        np_array = self._frame.values
-        
-        # Creamos una lista vacía para almacenar los resultados
-        results = []
-        
-        # Iteramos sobre cada fila del array y aplicamos la función a cada una de ellas
-        for row in np_array:
-            result = func(*row)
-            results.append(result)
-        
-        # Creamos una nueva columna en el DataFrame con los resultados
-        func_name = func.__name__
-        self._frame[func_name] = results
-        
-        return self._frame
\ No newline at end of file
+        temp_path = None
+        try:
+            fd, temp_path = tempfile.mkstemp(suffix=".xlsx", dir=os.path.dirname(self.save_path))
+            os.close(fd)
+            dataframe.mask(dataframe == "NULL", "").to_excel(temp_path, index=False)
+            DataExcel.transform_xlsx_values_to_text(temp_path)
+            os.replace(temp_path, self.save_path)
+            if self.use_cache:
+                self.write_cache_marker(self.save_path)
+            return True
+        except Exception as e:
+            logging.error(f"DataGuests : No se pudo guardar {self.save_path}: {e.__class__}: {e}")
+            self._save_error = e
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+    
+    def wait_saved(self) -> None:
+        """
+        Espera a que termine el guardado en segundo plano del archivo de invitados, si hay uno en curso.
+
+        Raises:
+            FailDataExcel: Si el último guardado falló. Los ID's generados no quedaron en el archivo, por lo que
+                no deben subirse a la base de datos: en la próxima carga se generarían otros distintos.
+        """
+        if self._save_thread is not None:
+            self._save_thread.join()
+            self._save_thread = None
+        error, self._save_error = self._save_error, None
+        if error is not None:
+            raise FailDataExcel(f"No se pudo guardar {self.save_path}: {error.__class__}: {error}") from error
@@ -3,22 +3,47 @@ import openpyxl
 import os
 import re
 import datetime
+import logging
+import queue
+import threading
 from Class.DataExcel import DataExcel
-from selenium import webdriver
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
+from Class.SendJournal import SendJournal
+from Class.MessageTemplates import MessageTemplates
 import time
+# selenium se importa dentro de los métodos que abren o controlan Chrome, para que generar o revisar
+# los mensajes (dry run) no necesite cargarlo
 
 
 class DataWsp(DataExcel):
     
-    def __init__(self):
-        self._path=self.find_path_to_wsp_file()
-        super().__init__(path=self._path,header="ID")
+    WSP_URL = "https://web.whatsapp.com/"
+    SEND_URL = "https://web.whatsapp.com/send?phone={phone}"
+    INPUT_XPATH = '/html/body/div[1]/div/div/div[5]/div/footer/div[1]/div/span[2]/div/div[2]/div[1]/div/div[1]/p'
+    OUT_MESSAGE_CSS = "div.message-out"
+    SENT_TICK_CSS = "span[data-icon^='msg-check'], span[data-icon^='msg-dblcheck']"
+    LOAD_TIMEOUT = 600
+    MESSAGE_TIMEOUT = 30
+    DELIVERY_TIMEOUT = 60
+    POLL_FREQUENCY = 0.1
+    
+    def __init__(self, path:str = None):
+        """
+        Carga el archivo de envíos de WhatsApp.
+
+        Args:
+            path (str, opcional): Ruta del archivo a cargar. Por defecto, Data/to_wsp.xlsx.
+        """
+        self._path=path or self.find_path_to_wsp_file()
+        super().__init__(path=self._path,header="ID",dtype_str=True)
         self._frame=self.load_excel()
         self.driver=None
+        self.drivers=[]
+        self.wsp_url=self.WSP_URL
+        self.send_url=self.SEND_URL
+        self.send_latency={}
+        self.journal=None
+        self._templates=None
+        self._messages={}
         
     def find_path_to_wsp_file(self)-> str:
         """
@@ -43,48 +68,209 @@ class DataWsp(DataExcel):
         path=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),"Data",f"wsp_status__{hora_actual}.xlsx")
         return path
     
-    def load_excel(self):
-        dataframe=pd.read_excel(self._path,dtype=str)
-        return dataframe
-    
     def save_wsp_data(self):
         self._frame.to_excel(self.path_save_wsp_data(),index=False)
         return True
     
     
-    def apply_function_to_rows(self, func):
+    def find_path_templates(self)-> str:
+        """
+        Busca la carpeta de plantillas de los mensajes de WhatsApp.
+
+        Returns:
+            str: Ruta de la carpeta de plantillas.
+        """
+        path=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),"Data","templates","wsp")
+        return path
+    
+    def path_save_wsp_preview(self)-> str:
+        """
+        Crea la ruta del archivo con la vista previa de los mensajes de WhatsApp.
+
+        Returns:
+            str: Ruta del archivo de vista previa.
+        """
+        hora_actual = datetime.datetime.now().strftime('%Y%m%d-%H%M')
+        path=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),"Data",f"wsp_preview__{hora_actual}.xlsx")
+        return path
+    
+    @property
+    def templates(self) -> MessageTemplates:
+        """Plantillas de mensajes; se cargan y compilan la primera vez que se usan."""
+        if self._templates is None:
+            self._templates = MessageTemplates(self.find_path_templates())
+        return self._templates
+    
+    def render_messages(self) -> dict:
+        """
+        Genera de una sola vez los mensajes de todos los invitados del dataframe, para que el envío no los vuelva
+        a crear fila por fila. Los ID's repetidos no se guardan y sus mensajes se crean al enviarlos.
+
+        Returns:
+            dict: Mensajes de cada invitado por ID; None si falta alguna plantilla para el invitado.
+        """
+        rendered = self.templates.render(self._frame)
+        ids = self._frame.iloc[:, 0]
+        unique = ~ids.duplicated(keep=False).to_numpy()
+        self._messages = {id: mensajes for id, mensajes, ok in zip(ids, rendered, unique) if ok}
+        return self._messages
+    
+    def dry_run_wsp(self, path:str = None) -> pd.DataFrame:
+        """
+        Genera los mensajes de todos los invitados y los guarda en un .xlsx sin enviarlos, para revisarlos.
+
+        Args:
+            path (str, opcional): Ruta del archivo a crear. Por defecto, Data/wsp_preview__<fecha>.xlsx.
+
+        Returns:
+            pd.DataFrame: Dataframe guardado, con ID, CELULAR y una columna MENSAJE_<n> por mensaje.
         """
-        Toma una función y la aplica a cada fila del dataframe. El resultado de la función se agrega en una nueva columna
-        al final del dataframe con el nombre de la función como header.
+        path = path or self.path_save_wsp_preview()
+        preview = self.templates.export(self._frame, path)
+        print(f"Vista previa de {len(preview)} invitados guardada en {path}")
+        return preview
+    
+    def find_path_wsp_journal(self)-> str:
+        """
+        Busca la ruta del registro SQLite de envíos de WhatsApp.
+
+        Returns:
+            str: Ruta del registro de envíos.
+        """
+        path=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),"Data","wsp_journal.sqlite3")
+        return path
+    
+    def find_path_wsp_profiles(self)-> str:
+        """
+        Busca la carpeta donde se guardan los perfiles de Chrome de cada sesión de WhatsApp.
+
+        Returns:
+            str: Ruta de la carpeta de perfiles.
+        """
+        path=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),"Data",".wsp_profiles")
+        return path
+    
+    @staticmethod
+    def create_driver(profile_dir:str = None, headless:bool = False):
+        """
+        Abre una nueva sesión de Chrome.
+
+        Args:
+            profile_dir (str, opcional): Carpeta del perfil de Chrome. Cada sesión de WhatsApp necesita su propio perfil,
+                que además conserva el inicio de sesión entre ejecuciones. Por defecto, None (perfil temporal).
+            headless (bool, opcional): Si es True, Chrome se abre sin ventana. Por defecto, False.
+
+        Returns:
+            webdriver.Chrome: Sesión de Chrome abierta.
+        """
+        from selenium import webdriver
+        options = webdriver.ChromeOptions()
+        if profile_dir:
+            options.add_argument(f"--user-data-dir={os.path.abspath(profile_dir)}")
+        if headless:
+            options.add_argument("--headless=new")
+        return webdriver.Chrome(options=options)
+    
+    def init_selenium_wsp(self, sessions:int = 1, profiles:list = None, headless:bool = False, login:bool = True):
+        """
+        Abre las sesiones de Chrome en WhatsApp Web y espera a que se escaneen los códigos QR.
+
+        Args:
+            sessions (int, opcional): Cantidad de sesiones a abrir. Se ignora si se indica `profiles`. Por defecto, 1.
+            profiles (list, opcional): Carpetas de perfil de Chrome, una por sesión. Si es None y `sessions` es mayor
+                a 1 se usan las carpetas Data/.wsp_profiles/sesion_<n>. Por defecto, None.
+            headless (bool, opcional): Si es True, Chrome se abre sin ventana. Por defecto, False.
+            login (bool, opcional): Si es True, espera a que se presione Enter después de escanear los códigos QR.
+                Por defecto, True.
+
+        Returns:
+            bool: True si las sesiones se abren con éxito.
+        """
+        if profiles is None:
+            if sessions <= 1:
+                profiles = [None]
+            else:
+                profiles = [os.path.join(self.find_path_wsp_profiles(), f"sesion_{n}") for n in range(1, sessions + 1)]
+        try:
+            for profile in profiles:
+                driver = self.create_driver(profile, headless=headless)
+                self.drivers.append(driver)
+                driver.get(self.wsp_url)
+        except Exception:
+            self.quit_selenium_wsp()
+            raise
+        self.driver = self.drivers[0]
+        if login:
+            input("Escanea el código QR de cada sesión y presiona Enter")
+        return True
+    
+    def quit_selenium_wsp(self):
+        """Cierra todas las sesiones de Chrome abiertas."""
+        for driver in self.drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                logging.warning(f"DataWsp : No se pudo cerrar una sesión de Chrome: {e.__class__}: {e}")
+        self.drivers=[]
+        self.driver=None
+    
+    @staticmethod
+    def driver_alive(driver) -> bool:
+        """Indica si la sesión de Chrome sigue respondiendo."""
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+    
+    NO_SESSIONS = "No se pudo enviar wsp - no quedan sesiones activas"
+    
+    def apply_function_to_rows_in_sessions(self, func, progress=None):
+        """
+        Igual que `apply_function_to_rows` en modo "thread", pero reparte las filas entre todas las sesiones abiertas
+        en `drivers`, con un hilo de `map_rows` por sesión. Cada fila toma una sesión libre y la devuelve al terminar,
+        por lo que una conversación lenta no detiene a las demás. La función recibe la sesión a usar en el argumento
+        `driver`. Si una sesión deja de responder no se vuelve a usar y sus filas pendientes las toman las demás;
+        si no queda ninguna, las filas restantes devuelven NO_SESSIONS. Si no hay sesiones abiertas, las filas se
+        procesan con `driver=None`. Las filas que lanzan una excepción devuelven un RowError.
         
         Args:
-            func (callable): Función a aplicar a cada fila del DataFrame.
+            func (callable): Función a aplicar a cada fila del DataFrame. Debe aceptar el argumento `driver`.
+            progress (callable, opcional): Función progress(hechas, total, filas_por_segundo), ver `map_rows`.
+                Por defecto, None.
             
         Returns:
             pandas.DataFrame: Dataframe original con una nueva columna que contiene los resultados de la función.
         """
-        # Convertimos el DataFrame a un array de numpy para mejorar la velocidad
-        np_array = self._frame.values
-        
-        # Creamos una lista vacía para almacenar los resultados
-        results = []
+        drivers = self.drivers or [None]
+        free = queue.Queue()
+        for driver in drivers:
+            free.put(driver)
+        alive = len(drivers)
+        lock = threading.Lock()
+        # Marca que se deja en la cola cuando ya no quedan sesiones, para que ningún hilo espere para siempre
+        no_sessions = object()
         
-        # Iteramos sobre cada fila del array y aplicamos la función a cada una de ellas
-        for row in np_array:
-            result = func(*row)
-            results.append(result)
-        
-        # Creamos una nueva columna en el DataFrame con los resultados
-        func_name = func.__name__
-        self._frame[func_name] = results
+        def send_row(*row):
+            nonlocal alive
+            driver = free.get()
+            if driver is no_sessions:
+                free.put(driver)
+                return self.NO_SESSIONS
+            try:
+                return func(*row, driver=driver)
+            finally:
+                if driver is None or self.driver_alive(driver):
+                    free.put(driver)
+                else:
+                    logging.error(f"DataWsp : La sesión {drivers.index(driver) + 1} dejó de responder")
+                    with lock:
+                        alive -= 1
+                        if alive == 0:
+                            free.put(no_sessions)
         
-        return self._frame
-    
-    def init_selenium_wsp(self):
-        self.driver = webdriver.Chrome()
-        self.driver.get('https://web.whatsapp.com/')
-        input("Escanea el código QR y presiona Enter")
-        return True   
+        return self.apply_function_to_rows(send_row, mode="thread", max_workers=len(drivers), capture_errors=True,
+                                           progress=progress, column=func.__name__)
 
     @staticmethod
     def procesar_celular(texto):
@@ -98,9 +284,9 @@ class DataWsp(DataExcel):
         Returns:
             list: Lista de números de celular con el prefijo '+51' agregado.
             
-            False: Si el texto es None, tiene menos de 6 caracteres o es igual a una de las cadenas "NULL", "none" o "None".
+            False: Si el texto no es str (por ejemplo None o NaN), tiene menos de 6 caracteres o es igual a una de las cadenas "NULL", "none" o "None".
         """
-        if not texto or len(texto) < 6 or texto.lower() in ["null", "none","nan"]:
+        if not isinstance(texto, str) or len(texto) < 6 or texto.lower() in ["null", "none","nan"]:
             # Si el texto es None, tiene menos de 6 caracteres o es igual a una de las cadenas "NULL", "none" o "None",
             # devolver False
             return False
@@ -116,94 +302,106 @@ class DataWsp(DataExcel):
     
     
     
-    def send_message_from_selenium(self,num_celular:list, mensajes:list):
-        
-        def paste_content(driver, el, content):
-            driver.execute_script(
-            f'''
-        const text = `{content}`;
+    @staticmethod
+    def paste_content(driver, el, content:str) -> None:
+        """Pega `content` en el elemento con un evento 'paste'; el texto se pasa como argumento y no dentro del script."""
+        driver.execute_script(
+            """
         const dataTransfer = new DataTransfer();
-        dataTransfer.setData('text', text);
-        const event = new ClipboardEvent('paste', {{
+        dataTransfer.setData('text', arguments[1]);
+        const event = new ClipboardEvent('paste', {
         clipboardData: dataTransfer,
         bubbles: true
-        }});
+        });
         arguments[0].dispatchEvent(event)
-        ''',
-            el)
-            
-        time.sleep(5)
+        """,
+            el, content)
+    
+    def wait_input_box(self, driver):
+        """Espera a que el cuadro de texto del chat abierto se pueda usar y lo devuelve."""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+        return WebDriverWait(driver, self.LOAD_TIMEOUT, poll_frequency=self.POLL_FREQUENCY).until(
+            EC.element_to_be_clickable((By.XPATH, self.INPUT_XPATH)))
+    
+    def count_sent_messages(self, driver) -> int:
+        """Cuenta las burbujas de mensajes enviados del chat abierto."""
+        return driver.execute_script("return document.querySelectorAll(arguments[0]).length", self.OUT_MESSAGE_CSS)
+    
+    def last_message_sent(self, driver) -> bool:
+        """Indica si la última burbuja enviada ya tiene el tick de enviado o entregado."""
+        return driver.execute_script(
+            """
+        const bubbles = document.querySelectorAll(arguments[0]);
+        return bubbles.length > 0 && bubbles[bubbles.length - 1].querySelector(arguments[1]) !== null;
+        """,
+            self.OUT_MESSAGE_CSS, self.SENT_TICK_CSS)
+    
+    def send_message_from_selenium(self,num_celular:list, mensajes:list, driver=None) -> list[dict]:
+        """
+        Envía los mensajes a cada número, esperando condiciones de la página en lugar de pausas fijas: que el cuadro
+        de texto esté listo, que aparezca la burbuja de cada mensaje y, antes de abrir el siguiente chat, que el último
+        mensaje tenga el tick de enviado (si no aparece en DELIVERY_TIMEOUT segundos sólo se registra una advertencia).
+        El cuadro de texto se busca una sola vez por chat y sólo se vuelve a buscar si la página lo reemplaza.
+
+        Args:
+            num_celular (list): Números de celular con prefijo, como los devuelve `procesar_celular`.
+            mensajes (list): Mensajes a enviar, en orden.
+            driver (webdriver.Chrome, opcional): Sesión a usar. Por defecto, `self.driver`.
+
+        Returns:
+            list[dict]: Por cada número, {"CELULAR": número, "SEGUNDOS": duración del envío, "ENTREGADO": bool}.
+
+        Raises:
+            TimeoutException: Si el chat no carga o algún mensaje no aparece enviado a tiempo.
+        """
+        from selenium.webdriver.common.keys import Keys
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+        
+        driver = driver or self.driver
+        report = []
         for num in num_celular:
-            url = f"https://web.whatsapp.com/send?phone={num}"
-            self.driver.get(url)
-            WebDriverWait(self.driver, 600).until(EC.element_to_be_clickable((By.XPATH, '/html/body/div[1]/div/div/div[5]/div/footer/div[1]/div/span[2]/div/div[2]/div[1]/div/div[1]/p')))
-            time.sleep(5)
+            start = time.perf_counter()
+            driver.get(self.send_url.format(phone=num))
+            input_box = self.wait_input_box(driver)
+            sent = self.count_sent_messages(driver)
             for mensaje in mensajes:
-                input_box = self.driver.find_element(By.XPATH, '/html/body/div[1]/div/div/div[5]/div/footer/div[1]/div/span[2]/div/div[2]/div[1]/div/div[1]/p')
-                paste_content(self.driver, input_box, mensaje)
-                input_box.send_keys(Keys.ENTER)
-                time.sleep(2)
+                try:
+                    self.paste_content(driver, input_box, mensaje)
+                    input_box.send_keys(Keys.ENTER)
+                except StaleElementReferenceException:
+                    input_box = self.wait_input_box(driver)
+                    self.paste_content(driver, input_box, mensaje)
+                    input_box.send_keys(Keys.ENTER)
+                sent += 1
+                WebDriverWait(driver, self.MESSAGE_TIMEOUT, poll_frequency=self.POLL_FREQUENCY).until(
+                    lambda d: self.count_sent_messages(d) >= sent)
             
-            print(f"Se envió mensaje completo a {num}")
+            # Si se abre otro chat antes de que el mensaje salga, WhatsApp puede descartarlo
+            try:
+                WebDriverWait(driver, self.DELIVERY_TIMEOUT, poll_frequency=self.POLL_FREQUENCY).until(
+                    self.last_message_sent)
+                delivered = True
+            except TimeoutException:
+                delivered = False
+                logging.warning(f"DataWsp : No se confirmó el envío del último mensaje a {num}")
             
+            elapsed = time.perf_counter() - start
+            report.append({"CELULAR": num, "SEGUNDOS": round(elapsed, 2), "ENTREGADO": delivered})
+            print(f"Se envió mensaje completo a {num} en {elapsed:.1f} s" + ("" if delivered else " (sin tick de envío)"))
         
-        return "Se envió mensaje wsp"
+        return report
     
     
     
     def crear_mensajes_del_novio_por_fila(self,id, sex, apellidos, nombres, number_gest, mesa, celular, msj,*args):
-        try:
-            # Generar el mensaje de WhatsApp
-            if sex == "F":
-                if number_gest == "1":
-                    mensaje1 = f"""🎊 Querida *{apellidos} {nombres}*, 🎊 tiene  *{number_gest}* silla reservada en la mesa *{mesa}* 🪑de nuestra recepción 🎉
-    ¡Los esperamos hoy en nuestra boda! 🤵👰 Por favor, visiten la web para más detalles 🌐
-    Ingresando el código secreto y dando click en enviar  📤:
-
-                    """
-                else:
-                    mensaje1 = f"""🎊 Querida *{apellidos} {nombres}*, 🎊 tiene  {number_gest} sillas reservada en la mesa *{mesa}* 🪑de nuestra recepción 🎉
-
-    ¡Los esperamos hoy en nuestra boda! 🤵👰 Por favor, visiten la web para más detalles 🌐
-    Ingresando el código secreto y dando click en enviar  📤:
-    """
-            elif sex == "M":
-                if number_gest == "1":
-                    mensaje1 = f"""🎊 Querido *{apellidos} {nombres}*,  🎊 tiene  {number_gest} silla reservada en la mesa *{mesa}* 🪑de nuestra recepción 🎉
-    ¡Los esperamos hoy en nuestra boda! 🤵👰 Por favor, visiten la web para más detalles 🌐
-    Ingresando el código secreto y dando click en enviar  📤:
-                    """
-                else:
-                    mensaje1 = f"""🎊 Querido *{apellidos} {nombres}*, 🎊 tiene  *{number_gest}* sillas reservada en la mesa *{mesa}* 🪑 de nuestra recepción 🎉
-     ¡Los esperamos hoy en nuestra boda! 🤵👰 Por favor, visiten la web para más detalles 🌐
-    Ingresando el código secreto y dando click en enviar  📤:       
-                    """
-            
-            mensaje2 = f"🔗https://aramir95.github.io/OurWedding.io/"
-
-            mensaje3= f"El código secreto 🔒 es:"
-            mensaje4 = f"{id}"
-            mensaje5 = f"""📍 Boda Religiosa
-⛪ Iglesia Evangélica Peregrina
-📌 Nicolás de Piérola 565, Barranca
-⏰ 03:00 PM - 04:00 PM
-🗺️ https://www.google.com/maps/dir/?api=1&destination=Nicol%C3%A1s%20de%20Pi%C3%A9rola%20565%2C%20Barranca%2015169
-
-📍 Recepción y Fiesta
-🏡 CASA BLANCA - GORRIONCITO
-📌 Urb. La Florida Mz. R Lt. 14/ Calle Miguel Grau
-⏰ 05:30 PM - Hasta que el cuerpo aguante 🕺💃
-🗺️ https://www.google.com/maps/dir/?api=1&destination=-10.7288611,-77.77438889999999
-Tiene  *{number_gest}* silla(s) reservada(s) en la mesa *{mesa}* 🪑 del local *CASA BLANCA - GORRIONCITO* 🏡
-
-¡Esperamos verlos allí! 🥳🥂💕"""
-
-            mensajes = [mensaje1, mensaje2, mensaje3, mensaje4, mensaje5]
-            return mensajes
-
-    
-        except Exception:
+        # Generar los mensajes de WhatsApp a partir de las plantillas de Data/templates/wsp
+        mensajes = self.templates.render_row(id, sex, apellidos, nombres, number_gest, mesa, celular, msj)
+        if mensajes is None:
             raise Exception("No se pudo crear el mensaje")
+        return mensajes
         
     def crear_mensajes_de_novia_por_fila(self,id, sex, apellidos, nombres, number_gest, mesa, celular, msj,*args):
         mensajes=self.crear_mensajes_del_novio_por_fila(id, sex, apellidos, nombres, number_gest, mesa, celular, msj,*args)
@@ -211,7 +409,7 @@ Tiene  *{number_gest}* silla(s) reservada(s) en la mesa *{mesa}* 🪑 del local
         return mensajes
         
     
-    def message_from_data_in_row_selenium(self,id, sex, apellidos, nombres, number_gest, mesa, celular, msj,*args):
+    def message_from_data_in_row_selenium(self,id, sex, apellidos, nombres, number_gest, mesa, celular, msj,*args, driver=None):
         # Procesar el número de celular
         num_celular = self.procesar_celular(celular)
         
@@ -219,23 +417,120 @@ Tiene  *{number_gest}* silla(s) reservada(s) en la mesa *{mesa}* 🪑 del local
         if not num_celular:
             return "No se pudo enviar wsp"
         
+        journal = self.journal
+        if journal is not None:
+            # Al reanudar una campaña se saltan los números que ya se enviaron
+            num_celular = [num for num in num_celular if not journal.completed(id, num)]
+            if not num_celular:
+                return "Se envió wsp"
+        
         try:
-            mensajes=self.crear_mensajes_del_novio_por_fila(id, sex, apellidos, nombres, number_gest, mesa, celular, msj,*args)
+            if id in self._messages:
+                mensajes = self._messages[id]
+                if mensajes is None:
+                    raise Exception("No se pudo crear el mensaje")
+                mensajes = list(mensajes)
+            else:
+                mensajes=self.crear_mensajes_del_novio_por_fila(id, sex, apellidos, nombres, number_gest, mesa, celular, msj,*args)
             mensajes.insert(0, ".")
-            self.send_message_from_selenium(num_celular, mensajes)
+            report = []
+            # Se envía número por número para registrar cada uno apenas termina
+            for num in num_celular:
+                if journal is not None:
+                    journal.start(id, num)
+                try:
+                    item = self.send_message_from_selenium([num], mensajes, driver=driver)[0]
+                except Exception as e:
+                    if journal is not None:
+                        journal.fail(id, num, f"{e.__class__.__name__}: {e}")
+                    raise
+                if journal is not None:
+                    journal.finish(id, num, seconds=item["SEGUNDOS"], delivered=item["ENTREGADO"])
+                report.append(item)
+            self.send_latency[id] = round(sum(item["SEGUNDOS"] for item in report), 2)
+            if journal is not None:
+                self.print_progress()
             return "Se envió wsp"
         except Exception as e:
             return f"No se pudo enviar wsp - problema al ejecutar: {e}"
     
+    def print_progress(self) -> None:
+        """Muestra la cantidad de números enviados en la ejecución actual, la velocidad y el tiempo restante estimado."""
+        progress = self.journal.progress()
+        eta = "?" if progress["eta_s"] is None else str(datetime.timedelta(seconds=int(progress["eta_s"])))
+        print(f"Progreso: {progress['enviados']}/{progress['total']} números, "
+              f"{progress['por_minuto']} números/min, ETA {eta}")
+    
+    def count_pending_numbers(self) -> int:
+        """Cuenta los números del dataframe que todavía no se enviaron según el registro de envíos."""
+        total = 0
+        for id, celular in zip(self._frame["ID"], self._frame["CELULAR"]):
+            for num in self.procesar_celular(celular) or []:
+                if self.journal is None or not self.journal.completed(id, num):
+                    total += 1
+        return total
+    
         
     
-    def MultipleMessageFromDataInRowSelenium(self):
-        self.init_selenium_wsp()
-        self.apply_function_to_rows(self.message_from_data_in_row_selenium)
-        self.save_wsp_data()
-        self.driver.quit()
-        self.driver=None
+    def MultipleMessageFromDataInRowSelenium(self, sessions:int = 1, profiles:list = None, headless:bool = False,
+                                             login:bool = True, resume:bool = False, campaign:str = None):
+        """
+        Envía los mensajes de todas las filas y guarda el resultado de cada envío en Data/wsp_status__<fecha>.xlsx.
+        El estado de cada número se registra además en Data/wsp_journal.sqlite3 apenas termina su envío, para poder
+        reanudar la campaña si la ejecución se corta.
+
+        Args:
+            sessions (int, opcional): Cantidad de sesiones de WhatsApp (cuentas) entre las que se reparten las filas.
+                Por defecto, 1.
+            profiles (list, opcional): Carpetas de perfil de Chrome, una por sesión. Por defecto, None.
+            headless (bool, opcional): Si es True, Chrome se abre sin ventana. Por defecto, False.
+            login (bool, opcional): Si es True, espera a que se escaneen los códigos QR. Por defecto, True.
+            resume (bool, opcional): Si es True, se saltan los números que ya se enviaron en la campaña; si es False,
+                se borra el registro de la campaña y se envía a todos. Por defecto, False.
+            campaign (str, opcional): Nombre de la campaña en el registro. Por defecto, el nombre del archivo cargado.
+
+        Returns:
+            bool: True al terminar los envíos.
+        """
+        campaign = campaign or os.path.splitext(os.path.basename(self._path))[0]
+        self.journal = SendJournal(self.find_path_wsp_journal(), campaign=campaign)
+        try:
+            if not resume:
+                self.journal.reset()
+            self.render_messages()
+            pending = self.count_pending_numbers()
+            print(f"Campaña '{campaign}': {pending} números pendientes")
+            self.journal.begin_run(pending)
+            if pending:
+                self.init_selenium_wsp(sessions=sessions, profiles=profiles, headless=headless, login=login)
+            try:
+                self.apply_function_to_rows_in_sessions(self.message_from_data_in_row_selenium)
+                self.report_send_latency()
+                self.save_wsp_data()
+            finally:
+                self.quit_selenium_wsp()
+            print(f"Registro de la campaña '{campaign}': {self.journal.summary()}")
+        finally:
+            self.journal.close()
+            self.journal = None
         return True
     
+    def report_send_latency(self) -> dict:
+        """
+        Agrega al dataframe la columna SEGUNDOS_WSP con la duración del envío a cada invitado y muestra un resumen.
+
+        Returns:
+            dict: Cantidad de envíos y segundos promedio, p50, p95 y máximo por invitado.
+        """
+        self._frame["SEGUNDOS_WSP"] = self._frame["ID"].map(self.send_latency)
+        latency = pd.Series(list(self.send_latency.values()), dtype=float)
+        if latency.empty:
+            return {"envios": 0}
+        summary = {"envios": int(latency.size), "promedio": round(float(latency.mean()), 2),
+                   "p50": round(float(latency.quantile(0.5)), 2), "p95": round(float(latency.quantile(0.95)), 2),
+                   "max": round(float(latency.max()), 2)}
+        print(f"Latencia de envío por invitado (s): {summary}")
+        return summary
+    
 
 #Documenta y optimiza todo el código de este documento
\ No newline at end of file
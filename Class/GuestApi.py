@@ -0,0 +1,208 @@
+import asyncio
+import concurrent.futures
+import logging
+import re
+import urllib.parse
+from Class.CrearDataBaseSQL import DataBaseMySQL
+
+
+class GuestApiServer:
+    """Servidor HTTP asíncrono que expone la consulta de invitados en `GET /api/<id>`.
+    Si la base de datos tiene métricas (`db.stats`), también las expone en `GET /metrics` en formato Prometheus.
+
+    Devuelve el mismo JSON que `DataBaseMySQL.consultar_id_and_return_json`. Las consultas a la base de datos
+    se ejecutan en un pool de hilos acotado al tamaño del pool de conexiones, para no bloquear el event loop,
+    y si la base de datos tiene caché los aciertos se responden directamente sin pasar por el pool de hilos.
+    Las conexiones HTTP se mantienen abiertas (keep-alive) entre peticiones.
+
+    Atributos:
+        db (DataBaseMySQL): Base de datos a consultar.
+        host (str): Interfaz donde escucha el servidor.
+        port (int): Puerto donde escucha el servidor.
+        max_concurrency (int): Cantidad máxima de consultas a la base de datos en curso a la vez.
+        keepalive_timeout (float): Segundos que una conexión puede estar inactiva antes de cerrarse.
+    """
+
+    ID_PATTERN = re.compile(r"[A-Za-z0-9]{1,32}")
+    JSON_TYPE = "application/json; charset=utf-8"
+    METRICS_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+    MAX_HEADER_SIZE = 8192
+    REASONS = {200: "OK", 204: "No Content", 400: "Bad Request", 404: "Not Found",
+               405: "Method Not Allowed", 500: "Internal Server Error"}
+
+    def __init__(self, db: DataBaseMySQL, host:str = "0.0.0.0", port:int = 8080, max_concurrency:int = 64,
+                 keepalive_timeout:float = 5):
+        """Inicializa el servidor sin empezar a escuchar.
+
+        Args:
+            db (DataBaseMySQL): Base de datos a consultar.
+            host (str, optional): Interfaz donde escucha el servidor. Defaults to "0.0.0.0".
+            port (int, optional): Puerto donde escucha el servidor. Defaults to 8080.
+            max_concurrency (int, optional): Consultas a la base de datos en curso a la vez. Defaults to 64.
+            keepalive_timeout (float, optional): Segundos de inactividad antes de cerrar una conexión. Defaults to 5.
+        """
+        self.db = db
+        self.host = host
+        self.port = int(port)
+        self.max_concurrency = max_concurrency
+        self.keepalive_timeout = keepalive_timeout
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=db.pool.max_size,
+                                                               thread_name_prefix="guest-api")
+        self._semaphore = None
+        self._server = None
+
+    async def start(self) -> None:
+        """Empieza a escuchar conexiones en `host`:`port`."""
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port,
+                                                  limit=self.MAX_HEADER_SIZE)
+        logging.info(f"GuestApiServer escuchando en {self.host}:{self.port}")
+
+    async def serve_forever(self) -> None:
+        """Inicia el servidor y atiende peticiones hasta que la tarea sea cancelada."""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Deja de aceptar conexiones y libera el pool de hilos."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self._executor.shutdown(wait=False)
+
+    async def lookup(self, id:str) -> bytes or None:
+        """Consulta un invitado sin bloquear el event loop.
+
+        Args:
+            id (str): id de consulta.
+
+        Returns:
+            bytes or None: JSON del invitado, o None si el id no existe.
+        """
+        cache = self.db.cache
+        if cache is not None:
+            found, json_bytes = cache.get(id)
+            if found:
+                return json_bytes
+            # Si el invitado cambia mientras se consulta, la respuesta anterior no se guarda en la caché
+            generation = cache.generation()
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            json_bytes = await loop.run_in_executor(self._executor, self.db.select_guest_json_bytes, id)
+        if cache is not None:
+            cache.set(id, json_bytes, generation=generation)
+        return json_bytes
+
+    async def handle_request(self, method:str, target:str) -> tuple[int, bytes, str]:
+        """Resuelve una petición y devuelve el código de estado, el cuerpo y el tipo de contenido de la respuesta.
+
+        Args:
+            method (str): Método HTTP de la petición.
+            target (str): Ruta de la petición, por ejemplo "/api/ABC123".
+
+        Returns:
+            tuple[int, bytes, str]: Código de estado HTTP, cuerpo y tipo de contenido (JSON salvo en /metrics).
+        """
+        if method == "OPTIONS":
+            return 204, b"", self.JSON_TYPE
+        if method not in ("GET", "HEAD"):
+            return 405, b'{"error": "Metodo no permitido"}', self.JSON_TYPE
+
+        path = urllib.parse.unquote(urllib.parse.urlsplit(target).path)
+        if path == "/metrics" and self.db.stats is not None:
+            return 200, self.db.stats.prometheus().encode("utf-8"), self.METRICS_TYPE
+        if not path.startswith("/api/"):
+            return 404, b'{"error": "Ruta no encontrada"}', self.JSON_TYPE
+        id = path[len("/api/"):].strip()
+        # Los códigos con caracteres inválidos no pueden existir, se rechazan sin consultar la base de datos
+        if not self.ID_PATTERN.fullmatch(id):
+            return 404, b'{"error": "Codigo no encontrado"}', self.JSON_TYPE
+
+        try:
+            json_bytes = await self.lookup(id)
+        except Exception as e:
+            logging.error(f"GuestApiServer : Error al consultar '{id}': {str(e)}")
+            return 500, b'{"error": "Error al consultar"}', self.JSON_TYPE
+        if json_bytes is None:
+            return 404, b'{"error": "Codigo no encontrado"}', self.JSON_TYPE
+        return 200, json_bytes, self.JSON_TYPE
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Atiende todas las peticiones de una conexión mientras se mantenga abierta (keep-alive)."""
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.keepalive_timeout)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._write_response(writer, 400, b'{"error": "Cabecera demasiado grande"}', False)
+                    break
+
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    await self._write_response(writer, 400, b'{"error": "Peticion invalida"}', False)
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(":")
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+
+                # El cuerpo de la petición no se usa, pero se descarta para poder leer la siguiente
+                content_length = headers.get("content-length", "0") or "0"
+                if not (content_length.isascii() and content_length.isdigit()):
+                    await self._write_response(writer, 400, b'{"error": "Content-Length invalido"}', False)
+                    break
+                content_length = int(content_length)
+                if content_length:
+                    await reader.readexactly(content_length)
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+
+                status, body, content_type = await self.handle_request(method.upper(), target)
+                await self._write_response(writer, status, b"" if method.upper() == "HEAD" else body, keep_alive,
+                                           content_length=len(body), content_type=content_type)
+                if not keep_alive:
+                    break
+        except Exception as e:
+            logging.error(f"GuestApiServer : Error en la conexión: {e.__class__}: {e}")
+        finally:
+            writer.close()
+
+    async def _write_response(self, writer: asyncio.StreamWriter, status:int, body:bytes, keep_alive:bool,
+                              content_length:int = None, content_type:str = JSON_TYPE) -> None:
+        """Escribe una respuesta HTTP/1.1 con cabeceras CORS, ya que la web se sirve desde otro dominio."""
+        headers = [f"HTTP/1.1 {status} {self.REASONS.get(status, '')}",
+                   f"Content-Type: {content_type}",
+                   f"Content-Length: {len(body) if content_length is None else content_length}",
+                   "Access-Control-Allow-Origin: *",
+                   "Access-Control-Allow-Methods: GET, OPTIONS",
+                   f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        if keep_alive:
+            headers.append(f"Keep-Alive: timeout={int(self.keepalive_timeout)}")
+        writer.write(("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+
+def run_server(db: DataBaseMySQL, host:str = "0.0.0.0", port:int = 8080, **kwargs) -> None:
+    """Inicia un GuestApiServer y lo mantiene en ejecución hasta interrumpirlo con Ctrl+C.
+
+    Args:
+        db (DataBaseMySQL): Base de datos a consultar.
+        host (str, optional): Interfaz donde escucha el servidor. Defaults to "0.0.0.0".
+        port (int, optional): Puerto donde escucha el servidor. Defaults to 8080.
+        **kwargs: Argumentos adicionales para GuestApiServer.
+    """
+    server = GuestApiServer(db, host=host, port=port, **kwargs)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._executor.shutdown(wait=False)
@@ -0,0 +1,126 @@
+import collections
+import threading
+import time
+
+
+class LookupCache:
+    """Caché en memoria, segura para hilos, de tamaño acotado (LRU) y con tiempo de vida (TTL).
+
+    Está pensada para guardar el JSON ya serializado de cada invitado, indexado por su ID.
+    También guarda los códigos inexistentes (caché negativa) con un TTL propio, para no consultar
+    la base de datos cada vez que alguien escribe un código equivocado.
+
+    Para que una lectura de la base de datos hecha antes de un cambio no vuelva a guardar el valor anterior,
+    quien llena la caché toma `generation()` antes de consultar y se lo pasa a `set`; si hubo una invalidación
+    en el medio, el valor no se guarda.
+
+    Atributos:
+        max_size (int): Cantidad máxima de entradas; al superarse se elimina la usada hace más tiempo.
+        ttl (float): Segundos de vida de una entrada encontrada.
+        negative_ttl (float): Segundos de vida de una entrada no encontrada.
+        hits (int): Consultas respondidas por la caché con un valor.
+        negative_hits (int): Consultas respondidas por la caché como código inexistente.
+        misses (int): Consultas que no estaban en la caché o estaban vencidas.
+        evictions (int): Entradas eliminadas por falta de espacio.
+    """
+
+    def __init__(self, max_size:int = 1024, ttl:float = 300, negative_ttl:float = 30):
+        """Inicializa la caché vacía.
+
+        Args:
+            max_size (int, optional): Cantidad máxima de entradas. Defaults to 1024.
+            ttl (float, optional): Segundos de vida de una entrada encontrada. Defaults to 300.
+            negative_ttl (float, optional): Segundos de vida de una entrada no encontrada. Defaults to 30.
+        """
+        if max_size < 1:
+            raise ValueError("max_size debe ser mayor a 0")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key:str) -> tuple[bool, bytes or None]:
+        """Busca una entrada vigente en la caché.
+
+        Args:
+            key (str): ID a buscar.
+
+        Returns:
+            tuple[bool, bytes or None]: (True, valor) si la entrada está en la caché, siendo valor None si el ID
+                se guardó como inexistente; (False, None) si no está o ya venció.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            if entry[0] is None:
+                self.negative_hits += 1
+            else:
+                self.hits += 1
+            return True, entry[0]
+
+    def generation(self) -> int:
+        """Devuelve la cantidad de invalidaciones hechas hasta ahora, para pasarla a `set`."""
+        with self._lock:
+            return self._generation
+
+    def set(self, key:str, value:bytes or None, generation:int = None) -> bool:
+        """Guarda una entrada en la caché, eliminando la usada hace más tiempo si se supera `max_size`.
+
+        Args:
+            key (str): ID a guardar.
+            value (bytes or None): JSON serializado del invitado, o None si el ID no existe.
+            generation (int, optional): Valor de `generation()` tomado antes de leer `value` de la base de datos.
+                Si desde entonces hubo una invalidación, el valor puede ser anterior a ella y no se guarda.
+                Defaults to None, se guarda siempre.
+
+        Returns:
+            bool: True si la entrada se guardó.
+        """
+        ttl = self.negative_ttl if value is None else self.ttl
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return True
+
+    def invalidate(self, keys:list[str] = None) -> None:
+        """Elimina entradas de la caché.
+
+        Args:
+            keys (list[str], optional): IDs a eliminar. Si es None se vacía toda la caché. Defaults to None.
+        """
+        with self._lock:
+            self._generation += 1
+            if keys is None:
+                self._entries.clear()
+                return
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def stats(self) -> dict:
+        """Devuelve los contadores de la caché.
+
+        Returns:
+            dict: Por ejemplo {"hits": 10, "negative_hits": 2, "misses": 3, "evictions": 0, "size": 5}.
+        """
+        with self._lock:
+            return {"hits": self.hits, "negative_hits": self.negative_hits, "misses": self.misses,
+                    "evictions": self.evictions, "size": len(self._entries)}
@@ -0,0 +1,191 @@
+import glob
+import itertools
+import os
+import re
+import string
+import numpy as np
+import pandas as pd
+
+
+class FailTemplate(Exception):
+    """Excepción que se lanza cuando una plantilla de mensaje no es válida."""
+    def __init__(self, message):
+        """Inicializa la excepción con un mensaje de error."""
+        self.message = message
+
+    def __str__(self):
+        return self.message
+
+
+class MessageTemplates:
+    """Plantillas de mensajes de WhatsApp cargadas desde archivos de texto y compiladas una sola vez.
+
+    Cada archivo `<orden>_<nombre>.txt` de la carpeta es un mensaje; los mensajes de un invitado se envían según
+    `<orden>`. Un mensaje puede tener variantes según el sexo del invitado y si tiene una o varias sillas, con archivos
+    `<orden>_<nombre>_<SEX>_<1|n>.txt` (por ejemplo `1_saludo_F_n.txt`); si un invitado no tiene variante ni archivo
+    general para algún mensaje, no se generan sus mensajes.
+
+    Las plantillas usan la sintaxis de `str.format` con los nombres de ROW_FIELDS, por ejemplo `{APELLIDOS}`.
+    Las columnas del dataframe se toman por posición, igual que los argumentos de las funciones por fila.
+
+    Atributos:
+        directory (str): Carpeta de las plantillas.
+    """
+
+    ROW_FIELDS = ["ID", "SEX", "APELLIDOS", "NOMBRES", "NUMBER_GUEST", "MESA", "CELULAR", "MSJ"]
+    FILE_PATTERN = re.compile(r"(?P<orden>\d+)_(?P<nombre>.+?)(?:_(?P<variante>[A-Z]+_(?:1|n)))?\.txt")
+
+    def __init__(self, directory:str):
+        """Carga y compila todas las plantillas de la carpeta.
+
+        Args:
+            directory (str): Carpeta de las plantillas.
+
+        Raises:
+            FailTemplate: Si la carpeta no tiene plantillas o alguna plantilla no es válida.
+        """
+        self.directory = directory
+        # {orden: {variante o None: piezas compiladas}}
+        self._templates = {}
+        for path in sorted(glob.glob(os.path.join(directory, "*.txt"))):
+            match = self.FILE_PATTERN.fullmatch(os.path.basename(path))
+            if match is None:
+                raise FailTemplate(f"Nombre de plantilla inválido: {os.path.basename(path)}")
+            with open(path, encoding="utf-8", newline="") as file:
+                pieces = self.compile(file.read(), name=os.path.basename(path))
+            self._templates.setdefault(int(match["orden"]), {})[match["variante"]] = pieces
+        if not self._templates:
+            raise FailTemplate(f"No se encontraron plantillas en {directory}")
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    @classmethod
+    def compile(cls, text:str, name:str = "") -> list[tuple[str, str or None]]:
+        """
+        Separa una plantilla en pares (texto literal, campo), validando que los campos existan.
+
+        Args:
+            text (str): Texto de la plantilla.
+            name (str, optional): Nombre de la plantilla para los mensajes de error. Defaults to "".
+
+        Returns:
+            list[tuple[str, str or None]]: Piezas de la plantilla; el campo es None en la última pieza literal.
+
+        Raises:
+            FailTemplate: Si la plantilla tiene un campo desconocido, un formato o una conversión.
+        """
+        try:
+            parsed = list(string.Formatter().parse(text))
+        except ValueError as e:
+            raise FailTemplate(f"Plantilla {name} inválida: {e}")
+        pieces = []
+        for literal, field, spec, conversion in parsed:
+            if field is not None and (field not in cls.ROW_FIELDS or spec or conversion):
+                raise FailTemplate(f"Plantilla {name}: campo inválido '{{{field}}}', los campos válidos son {cls.ROW_FIELDS}")
+            pieces.append((literal, field))
+        return pieces
+
+    @staticmethod
+    def variant_key(sex, number_guest) -> str:
+        """Devuelve la variante de un invitado, por ejemplo "F_1" o "M_n"."""
+        return f"{sex}_{'1' if number_guest == '1' else 'n'}"
+
+    def render_row(self, *row) -> list[str] or None:
+        """
+        Genera los mensajes de un invitado.
+
+        Args:
+            *row: Valores de la fila en el orden de ROW_FIELDS.
+
+        Returns:
+            list[str] or None: Mensajes en orden, o None si falta alguna plantilla para la variante del invitado.
+        """
+        values = dict(zip(self.ROW_FIELDS, row))
+        key = self.variant_key(values.get("SEX"), values.get("NUMBER_GUEST"))
+        mensajes = []
+        for orden in sorted(self._templates):
+            variants = self._templates[orden]
+            pieces = variants.get(key, variants.get(None))
+            if pieces is None:
+                return None
+            mensajes.append("".join(literal + ("" if field is None else str(values.get(field)))
+                                    for literal, field in pieces))
+        return mensajes
+
+    def render(self, frame:pd.DataFrame) -> list[list[str] or None]:
+        """
+        Genera los mensajes de todos los invitados del dataframe, columna por columna en lugar de fila por fila.
+
+        Args:
+            frame (pd.DataFrame): Dataframe de invitados, con las columnas en el orden de ROW_FIELDS.
+
+        Returns:
+            list[list[str] or None]: Por cada fila, sus mensajes en orden, o None si falta alguna plantilla
+                para la variante del invitado.
+        """
+        frame = frame.iloc[:, :len(self.ROW_FIELDS)].copy()
+        frame.columns = self.ROW_FIELDS[:frame.shape[1]]
+        keys = frame["SEX"].astype(str) + np.where(frame["NUMBER_GUEST"] == "1", "_1", "_n")
+        keys = keys.to_numpy(dtype=object)
+        # Texto de cada campo usado, tal como lo escribiría str(), incluyendo "nan" en las celdas vacías
+        text = {}
+        for field in {field for variants in self._templates.values() for pieces in variants.values()
+                      for _, field in pieces if field is not None}:
+            values = frame[field].to_numpy(dtype=object, na_value="nan")
+            if pd.api.types.infer_dtype(values, skipna=False) != "string":
+                values = values.astype(str).astype(object)
+            text[field] = values
+
+        columns = []
+        valid = np.ones(len(frame), dtype=bool)
+        for orden in sorted(self._templates):
+            variants = self._templates[orden]
+            column = np.full(len(frame), None, dtype=object)
+            # Las filas sin variante propia usan la plantilla general, si existe
+            general = np.isin(keys, [key for key in variants if key is not None], invert=True)
+            for key, pieces in variants.items():
+                mask = general if key is None else keys == key
+                if mask.any():
+                    column[mask] = self._render_pieces(pieces, text, mask)
+            valid &= pd.notna(column)
+            columns.append(column)
+
+        rows = np.stack(columns, axis=1).tolist() if columns else [[] for _ in range(len(frame))]
+        return [mensajes if ok else None for mensajes, ok in zip(rows, valid)]
+
+    @staticmethod
+    def _render_pieces(pieces:list, text:dict, mask:np.ndarray) -> np.ndarray:
+        """Genera una plantilla para las filas de `mask`, uniendo las piezas de cada fila con un solo `join`."""
+        rendered = np.empty(int(mask.sum()), dtype=object)
+        if all(field is None for _, field in pieces):
+            # Sin campos todas las filas comparten el mismo texto
+            rendered[:] = "".join(literal for literal, _ in pieces)
+            return rendered
+        sequences = []
+        for literal, field in pieces:
+            if literal:
+                sequences.append(itertools.repeat(literal))
+            if field is not None:
+                sequences.append(text[field][mask])
+        rendered[:] = list(map("".join, zip(*sequences)))
+        return rendered
+
+    def export(self, frame:pd.DataFrame, path:str) -> pd.DataFrame:
+        """
+        Genera los mensajes de todos los invitados y los guarda en un archivo .xlsx sin enviarlos, para revisarlos.
+
+        Args:
+            frame (pd.DataFrame): Dataframe de invitados, con las columnas en el orden de ROW_FIELDS.
+            path (str): Ruta del archivo .xlsx a crear.
+
+        Returns:
+            pd.DataFrame: Dataframe guardado, con ID, CELULAR y una columna MENSAJE_<n> por mensaje.
+        """
+        rendered = self.render(frame)
+        preview = pd.DataFrame([mensajes or [None] * len(self) for mensajes in rendered],
+                               columns=[f"MENSAJE_{n}" for n in range(1, len(self) + 1)])
+        preview.insert(0, "ID", frame.iloc[:, 0].to_numpy())
+        preview.insert(1, "CELULAR", frame.iloc[:, self.ROW_FIELDS.index("CELULAR")].to_numpy())
+        preview.to_excel(path, index=False)
+        return preview
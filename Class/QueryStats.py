@@ -0,0 +1,131 @@
+import bisect
+import collections
+import logging
+import re
+import threading
+
+
+class QueryStats:
+    """Métricas, seguras para hilos, de las sentencias SQL ejecutadas por `DataBaseMySQL`.
+
+    Por cada operación (select, insert, update, delete, ddl, commit u other) cuenta las sentencias, los errores y las filas,
+    y acumula un histograma de latencias. Las sentencias que tardan al menos `slow_threshold` segundos se registran
+    en el log como advertencia y se guardan las últimas `slow_log_size` para consultarlas con `slow_queries`.
+    Se puede usar cualquier otro objeto con un método `record` con la misma firma en su lugar.
+
+    Atributos:
+        slow_threshold (float): Segundos a partir de los cuales una sentencia se considera lenta.
+        buckets (tuple[float]): Límites superiores, en segundos, de los intervalos del histograma.
+    """
+
+    BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+    OPERATIONS = {"select": "select", "insert": "insert", "replace": "insert", "load": "insert", "update": "update",
+                  "delete": "delete",
+                  "create": "ddl", "drop": "ddl", "alter": "ddl", "truncate": "ddl", "rename": "ddl",
+                  "commit": "commit"}
+    FIRST_WORD = re.compile(r"\s*\(?\s*(\w+)")
+    METRIC_PREFIX = "ourwedding_sql"
+
+    def __init__(self, slow_threshold:float = 1.0, buckets:tuple = BUCKETS, slow_log_size:int = 100):
+        """Inicializa las métricas vacías.
+
+        Args:
+            slow_threshold (float, optional): Segundos a partir de los cuales una sentencia es lenta. Defaults to 1.0.
+            buckets (tuple, optional): Límites de los intervalos del histograma en segundos. Defaults to BUCKETS.
+            slow_log_size (int, optional): Cantidad de sentencias lentas que se guardan. Defaults to 100.
+        """
+        self.slow_threshold = slow_threshold
+        self.buckets = tuple(sorted(buckets))
+        self._slow = collections.deque(maxlen=slow_log_size)
+        self._lock = threading.Lock()
+        self._operations = {}
+
+    @classmethod
+    def operation(cls, statement:str) -> str:
+        """Devuelve la operación de una sentencia según su primera palabra, por ejemplo "select" o "ddl"."""
+        match = cls.FIRST_WORD.match(statement or "")
+        return cls.OPERATIONS.get(match.group(1).lower(), "other") if match else "other"
+
+    def record(self, statement:str, seconds:float, rows:int = 0, error:bool = False) -> None:
+        """Registra una sentencia ejecutada.
+
+        Args:
+            statement (str): Sentencia SQL, sin los valores de los parámetros.
+            seconds (float): Duración de la sentencia en segundos.
+            rows (int, optional): Filas devueltas o afectadas. Defaults to 0.
+            error (bool, optional): True si la sentencia falló. Defaults to False.
+        """
+        operation = self.operation(statement)
+        with self._lock:
+            stats = self._operations.get(operation)
+            if stats is None:
+                stats = self._operations[operation] = {"count": 0, "errors": 0, "rows": 0, "seconds": 0.0,
+                                                       "max_seconds": 0.0,
+                                                       "buckets": [0] * (len(self.buckets) + 1)}
+            stats["count"] += 1
+            stats["errors"] += int(error)
+            stats["rows"] += max(rows or 0, 0)
+            stats["seconds"] += seconds
+            stats["max_seconds"] = max(stats["max_seconds"], seconds)
+            stats["buckets"][bisect.bisect_left(self.buckets, seconds)] += 1
+            slow = seconds >= self.slow_threshold
+            if slow:
+                self._slow.append({"operation": operation, "seconds": round(seconds, 4), "rows": rows,
+                                   "error": error, "statement": statement[:500]})
+        if slow:
+            logging.warning(f"QueryStats : Sentencia lenta ({seconds:.3f} s, {rows} filas): {statement[:200]}")
+
+    def slow_queries(self) -> list[dict]:
+        """Devuelve las últimas sentencias lentas, de la más antigua a la más reciente."""
+        with self._lock:
+            return list(self._slow)
+
+    def snapshot(self) -> dict:
+        """Devuelve una copia de las métricas de cada operación.
+
+        Returns:
+            dict: Por ejemplo {"select": {"count": 10, "errors": 0, "rows": 10, "seconds": 0.05, "max_seconds": 0.01,
+                "avg_seconds": 0.005, "histogram": {"0.001": 2, ..., "+Inf": 10}}}. El histograma es acumulado:
+                cada intervalo cuenta las sentencias que tardaron como máximo ese límite.
+        """
+        with self._lock:
+            operations = {operation: dict(stats, buckets=list(stats["buckets"]))
+                          for operation, stats in self._operations.items()}
+        snapshot = {}
+        for operation, stats in sorted(operations.items()):
+            cumulative, histogram = 0, {}
+            for bound, count in zip(list(self.buckets) + ["+Inf"], stats.pop("buckets")):
+                cumulative += count
+                histogram[str(bound)] = cumulative
+            stats["avg_seconds"] = stats["seconds"] / stats["count"] if stats["count"] else 0.0
+            stats["histogram"] = histogram
+            snapshot[operation] = stats
+        return snapshot
+
+    def prometheus(self) -> str:
+        """Devuelve las métricas en el formato de texto de Prometheus."""
+        prefix = self.METRIC_PREFIX
+        lines = [f"# HELP {prefix}_queries_total Sentencias SQL ejecutadas.",
+                 f"# TYPE {prefix}_queries_total counter"]
+        snapshot = self.snapshot()
+        lines += [f'{prefix}_queries_total{{operation="{op}"}} {s["count"]}' for op, s in snapshot.items()]
+        lines += [f"# HELP {prefix}_errors_total Sentencias SQL que fallaron.",
+                  f"# TYPE {prefix}_errors_total counter"]
+        lines += [f'{prefix}_errors_total{{operation="{op}"}} {s["errors"]}' for op, s in snapshot.items()]
+        lines += [f"# HELP {prefix}_rows_total Filas devueltas o afectadas.",
+                  f"# TYPE {prefix}_rows_total counter"]
+        lines += [f'{prefix}_rows_total{{operation="{op}"}} {s["rows"]}' for op, s in snapshot.items()]
+        lines += [f"# HELP {prefix}_duration_seconds Duración de las sentencias SQL.",
+                  f"# TYPE {prefix}_duration_seconds histogram"]
+        for op, s in snapshot.items():
+            lines += [f'{prefix}_duration_seconds_bucket{{operation="{op}",le="{bound}"}} {count}'
+                      for bound, count in s["histogram"].items()]
+            lines.append(f'{prefix}_duration_seconds_sum{{operation="{op}"}} {s["seconds"]}')
+            lines.append(f'{prefix}_duration_seconds_count{{operation="{op}"}} {s["count"]}')
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Borra todas las métricas y el registro de sentencias lentas."""
+        with self._lock:
+            self._operations.clear()
+            self._slow.clear()
@@ -0,0 +1,141 @@
+import sqlite3
+import threading
+import time
+
+
+class SendJournal:
+    """Registro persistente en SQLite del estado de envío de cada número de cada invitado.
+
+    Cada número se registra apenas termina su envío, por lo que si Chrome se cierra o la sesión de WhatsApp se cae
+    a mitad de una campaña, al volver a ejecutarla se pueden saltar los números ya enviados. También lleva la cuenta
+    de los envíos de la ejecución actual para calcular la velocidad y el tiempo restante estimado (ETA).
+
+    Estados de un número:
+        "enviando": El envío empezó pero no terminó; si la ejecución se cortó, el número se vuelve a enviar.
+        "enviado": Todos los mensajes se enviaron.
+        "error": El envío falló; el número se vuelve a intentar al reanudar.
+
+    Atributos:
+        path (str): Ruta del archivo SQLite.
+        campaign (str): Nombre de la campaña; cada campaña lleva su propio registro dentro del mismo archivo.
+    """
+
+    SENT = "enviado"
+    SENDING = "enviando"
+    ERROR = "error"
+
+    def __init__(self, path:str, campaign:str = "default"):
+        """Abre (o crea) el registro y carga los números ya enviados de la campaña.
+
+        Args:
+            path (str): Ruta del archivo SQLite.
+            campaign (str, optional): Nombre de la campaña. Defaults to "default".
+        """
+        self.path = path
+        self.campaign = campaign
+        self._lock = threading.Lock()
+        # Una sola conexión compartida entre los hilos de las sesiones, protegida por el lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""CREATE TABLE IF NOT EXISTS envios (
+                                  campaign TEXT NOT NULL,
+                                  guest_id TEXT NOT NULL,
+                                  phone TEXT NOT NULL,
+                                  status TEXT NOT NULL,
+                                  attempts INTEGER NOT NULL DEFAULT 0,
+                                  seconds REAL,
+                                  delivered INTEGER,
+                                  error TEXT,
+                                  updated_at REAL NOT NULL,
+                                  PRIMARY KEY (campaign, guest_id, phone))""")
+        self._conn.commit()
+        self._done = {(guest_id, phone) for guest_id, phone in self._conn.execute(
+            "SELECT guest_id, phone FROM envios WHERE campaign = ? AND status = ?", (campaign, self.SENT))}
+        self._run_start = time.monotonic()
+        self._run_total = 0
+        self._run_done = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def completed(self, guest_id:str, phone:str) -> bool:
+        """Indica si el número del invitado ya se envió en esta campaña."""
+        return (str(guest_id), phone) in self._done
+
+    def start(self, guest_id:str, phone:str) -> None:
+        """Registra que empezó el envío a un número."""
+        self._write(guest_id, phone, self.SENDING, attempts=1)
+
+    def finish(self, guest_id:str, phone:str, seconds:float = None, delivered:bool = None) -> None:
+        """Registra que terminó el envío a un número y lo cuenta para la velocidad de la ejecución actual."""
+        self._write(guest_id, phone, self.SENT, seconds=seconds, delivered=delivered)
+        with self._lock:
+            self._done.add((str(guest_id), phone))
+            self._run_done += 1
+
+    def fail(self, guest_id:str, phone:str, error:str) -> None:
+        """Registra que falló el envío a un número."""
+        self._write(guest_id, phone, self.ERROR, error=str(error)[:500])
+
+    def _write(self, guest_id:str, phone:str, status:str, attempts:int = 0, seconds:float = None,
+               delivered:bool = None, error:str = None) -> None:
+        """Inserta o actualiza el estado de un número y lo guarda en disco de inmediato."""
+        with self._lock:
+            self._conn.execute(
+                """INSERT INTO envios (campaign, guest_id, phone, status, attempts, seconds, delivered, error, updated_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT (campaign, guest_id, phone) DO UPDATE SET
+                       status = excluded.status,
+                       attempts = attempts + excluded.attempts,
+                       seconds = COALESCE(excluded.seconds, seconds),
+                       delivered = COALESCE(excluded.delivered, delivered),
+                       error = excluded.error,
+                       updated_at = excluded.updated_at""",
+                (self.campaign, str(guest_id), phone, status, attempts, seconds,
+                 None if delivered is None else int(delivered), error, time.time()))
+            self._conn.commit()
+
+    def reset(self) -> None:
+        """Elimina el registro de la campaña, para volver a enviar a todos."""
+        with self._lock:
+            self._conn.execute("DELETE FROM envios WHERE campaign = ?", (self.campaign,))
+            self._conn.commit()
+            self._done.clear()
+
+    def begin_run(self, total:int) -> None:
+        """Empieza a medir la velocidad de una ejecución que tiene `total` números pendientes."""
+        with self._lock:
+            self._run_start = time.monotonic()
+            self._run_total = total
+            self._run_done = 0
+
+    def progress(self) -> dict:
+        """Devuelve el avance de la ejecución actual.
+
+        Returns:
+            dict: Por ejemplo {"enviados": 12, "total": 300, "por_minuto": 4.5, "eta_s": 3840.0}.
+                `eta_s` es None mientras no haya envíos para estimar la velocidad.
+        """
+        with self._lock:
+            elapsed = time.monotonic() - self._run_start
+            done, total = self._run_done, self._run_total
+        rate = done / elapsed if elapsed > 0 else 0.0
+        eta = (total - done) / rate if rate > 0 else None
+        return {"enviados": done, "total": total, "por_minuto": round(rate * 60, 2),
+                "eta_s": None if eta is None else round(eta, 1)}
+
+    def summary(self) -> dict:
+        """Devuelve la cantidad de números de la campaña en cada estado, por ejemplo {"enviado": 10, "error": 2}."""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM envios WHERE campaign = ? GROUP BY status",
+                                      (self.campaign,)).fetchall()
+        return dict(rows)
+
+    def close(self) -> None:
+        """Cierra el archivo SQLite."""
+        with self._lock:
+            self._conn.close()
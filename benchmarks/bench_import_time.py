@@ -0,0 +1,111 @@
+"""Benchmark del tiempo de importación de cada script de entrada, medido con `python -X importtime`.
+
+Para cada script (ActualizarSQL.py, ApiInvitados.py, main.py, wsp_envio_mensaje_auto.py) se ejecutan sólo sus
+sentencias import de nivel superior en un proceso nuevo, sin conectarse a la base de datos ni abrir Chrome, y se
+reporta el tiempo total de importación, los módulos más pesados y cuáles de las dependencias pesadas u opcionales
+(pandas, openpyxl, xlrd, selenium, win32com) se cargaron. Los módulos que el intérprete importa al iniciar
+(`python -c pass`) no se cuentan. De varias repeticiones se reporta la más rápida.
+
+Uso:
+    python benchmarks/bench_import_time.py
+    python benchmarks/bench_import_time.py --scripts ApiInvitados.py --repeat 10 --top 15
+"""
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPTS = ["ActualizarSQL.py", "ApiInvitados.py", "main.py", "wsp_envio_mensaje_auto.py"]
+HEAVY_MODULES = ["pandas", "openpyxl", "xlrd", "selenium", "win32com"]
+
+
+def script_imports(script:str) -> str:
+    """Devuelve el código con sólo las sentencias import de nivel superior del script."""
+    with open(os.path.join(ROOT, script), encoding="utf-8") as file:
+        tree = ast.parse(file.read(), filename=script)
+    imports = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    return "\n".join(ast.unparse(node) for node in imports) or "pass"
+
+
+def run_importtime(code:str) -> tuple[list[tuple[str, int, int]], str or None]:
+    """Ejecuta `code` con -X importtime en un proceso nuevo.
+
+    Returns:
+        tuple: Lista de (módulo, microsegundos propios, microsegundos acumulados) de los módulos de nivel superior,
+            en orden de importación, y el error del proceso o None si terminó bien.
+    """
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT,
+                             capture_output=True, text=True)
+    modules = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, self_us, cumulative_us, name = (part for part in line.replace("import time:", "|", 1).split("|"))
+        # Los módulos importados por otros aparecen con más sangría; sólo se suman los de nivel superior
+        if len(name) - len(name.lstrip()) == 1:
+            modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    error = None
+    if process.returncode != 0:
+        error = process.stderr.strip().splitlines()[-1] if process.stderr.strip() else f"código {process.returncode}"
+    return modules, error
+
+
+def loaded_modules(code:str) -> set[str]:
+    """Devuelve los paquetes de HEAVY_MODULES que quedan cargados tras ejecutar `code`."""
+    check = (f"{code}\nimport sys\n"
+             f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    process = subprocess.run([sys.executable, "-c", check], cwd=ROOT, capture_output=True, text=True)
+    return set(process.stdout.split()) if process.returncode == 0 else set()
+
+
+def measure(script:str, startup:set, repeat:int) -> dict:
+    """Mide las importaciones de un script y devuelve la repetición más rápida."""
+    code = script_imports(script)
+    best = None
+    for _ in range(repeat):
+        modules, error = run_importtime(code)
+        if error:
+            return {"script": script, "error": error}
+        modules = [module for module in modules if module[0] not in startup]
+        total = sum(cumulative for _, _, cumulative in modules)
+        if best is None or total < best["total_ms"] * 1000:
+            best = {"script": script, "total_ms": total / 1000,
+                    "modules": sorted(modules, key=lambda module: module[2], reverse=True)}
+    best["heavy"] = sorted(loaded_modules(code))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scripts", nargs="+", default=SCRIPTS, help="Scripts de entrada a medir")
+    parser.add_argument("--repeat", type=int, default=5, help="Repeticiones por script")
+    parser.add_argument("--top", type=int, default=8, help="Cantidad de módulos más pesados a mostrar")
+    parser.add_argument("--output", help="Archivo JSON donde guardar los resultados")
+    args = parser.parse_args()
+
+    startup = {name for name, _, _ in run_importtime("pass")[0]}
+    results = []
+    for script in args.scripts:
+        result = measure(script, startup, args.repeat)
+        results.append(result)
+        if "error" in result:
+            print(f"{script}: no se pudo importar ({result['error']})\n")
+            continue
+        print(f"{script}: {result['total_ms']:.1f} ms  (cargados: {', '.join(result['heavy']) or 'ninguno'})")
+        for name, _, cumulative in result["modules"][:args.top]:
+            print(f"    {cumulative / 1000:9.1f} ms  {name}")
+        print()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump({"python": sys.version.split()[0], "platform": sys.platform,
+                       "results": [{**result, "modules": result.get("modules", [])[:args.top]} for result in results]},
+                      file, indent=2)
+        print(f"Resultados guardados en {args.output}")
+
+
+if __name__ == "__main__":
+    main()
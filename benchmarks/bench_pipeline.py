@@ -0,0 +1,345 @@
+"""Benchmark del flujo Excel → DataFrame → MySQL con listas de invitados sintéticas.
+
+Genera archivos con las columnas de Data/guest.xlsx (ID, SEX, APELLIDOS, NOMBRES, NUMBER_GUEST, MESA, CELULAR,
+CONFIRMADO) de 1k, 10k, 100k y 1M filas, y mide el tiempo y la memoria máxima (RSS) de:
+
+    DataExcel.path_verify           (archivo nuevo y archivo ya normalizado)
+    DataExcel.load_excel            (leyendo el Excel y leyendo la caché)
+    DataGuests.reload_excel
+    DataBaseMySQL.from_dataframe_create_table  (INSERT por lotes y LOAD DATA LOCAL INFILE)
+    DataBaseMySQL.consultar_id_and_return_json
+
+Cada medición se ejecuta en un proceso nuevo, para que la memoria de una no afecte a la siguiente. Los archivos
+de entrada (el Excel normalizado, su caché y el DataFrame para las mediciones de base de datos) se preparan antes
+en otro proceso, de modo que la memoria máxima de cada medición no incluya esa preparación; junto a ella se
+reporta la memoria del proceso al empezar la medición (`rss_inicial_mb`). Las mediciones de base de datos necesitan un servidor MySQL o MariaDB local de prueba, por ejemplo:
+
+    docker run --rm -d -p 3306:3306 -e MARIADB_ALLOW_EMPTY_ROOT_PASSWORD=1 mariadb
+
+La base de datos `--db-name` se crea si no existe. Si no hay servidor, esas mediciones se omiten.
+Los resultados se guardan en JSON (por defecto en benchmarks/results/) y se pueden comparar con una ejecución
+anterior con --compare. Con 1M de filas la generación del archivo y la carga tardan varios minutos; los archivos
+generados se reutilizan entre ejecuciones si se indica --workdir.
+
+Uso:
+    python benchmarks/bench_pipeline.py --rows 1000 10000
+    python benchmarks/bench_pipeline.py --compare benchmarks/results/pipeline-<commit>-<fecha>.json
+"""
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import random
+import shutil
+import string
+import subprocess
+import sys
+import tempfile
+import time
+from queue import Empty
+
+import openpyxl
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+COLUMNS = ["ID", "SEX", "APELLIDOS", "NOMBRES", "NUMBER_GUEST", "MESA", "CELULAR", "CONFIRMADO"]
+SIZES = [1000, 10000, 100000, 1000000]
+STEPS = ["path_verify", "path_verify_normalizado", "load_excel", "load_excel_cache", "reload_excel",
+         "from_dataframe_create_table", "from_dataframe_create_table_infile", "consultar_id_and_return_json"]
+DB_STEPS = {"from_dataframe_create_table", "from_dataframe_create_table_infile", "consultar_id_and_return_json"}
+# Mediciones que crean la tabla de invitados que usa consultar_id_and_return_json
+TABLE_STEPS = {"from_dataframe_create_table", "from_dataframe_create_table_infile"}
+LOOKUPS = 1000
+
+
+def create_synthetic_guest_file(path:str, rows:int) -> None:
+    """Crea una lista de invitados con `rows` filas, con números como números y algunos ID's y celdas vacías."""
+    rng = random.Random(rows)
+    letters = string.ascii_uppercase
+    wb = openpyxl.Workbook(write_only=True)
+    sheet = wb.create_sheet("Hoja1")
+    sheet.append(COLUMNS)
+    for r in range(rows):
+        sheet.append(["" if r % 20 == 0 else "".join(rng.choices(letters + string.digits, k=6)),
+                      rng.choice("MF"),
+                      "".join(rng.choices(letters, k=rng.randint(4, 12))).lower(),
+                      "".join(rng.choices(letters, k=rng.randint(3, 10))).lower(),
+                      rng.randint(1, 6),
+                      rng.randint(1, 60),
+                      None if r % 7 == 0 else rng.randint(900000000, 999999999),
+                      rng.choice([None, "si", "no"])])
+    wb.save(path)
+
+
+def peak_rss_mb() -> float or None:
+    """Memoria máxima (RSS) usada hasta ahora por el proceso, en MB."""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss está en KB en Linux y en bytes en macOS
+        return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+    except ImportError:
+        try:
+            import psutil
+            return round(psutil.Process().memory_info().peak_wset / 2**20, 1)
+        except Exception:
+            return None
+
+
+def connect_database(db_config:dict, local_infile:bool = False):
+    """Crea la base de datos de prueba si no existe y devuelve un DataBaseMySQL conectado a ella."""
+    import pymysql
+    from Class.CrearDataBaseSQL import DataBaseMySQL
+
+    conn = pymysql.connect(host=db_config["host"], port=db_config["port"], user=db_config["user"],
+                           password=db_config["password"])
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{db_config['database']}`")
+    finally:
+        conn.close()
+    return DataBaseMySQL(host=db_config["host"], port=db_config["port"], user=db_config["user"],
+                         password=db_config["password"], database_name=db_config["database"],
+                         local_infile=local_infile)
+
+
+def input_paths(rows:int, workdir:str) -> dict:
+    """Rutas de los archivos de entrada de las mediciones de `rows` filas."""
+    return {"work": os.path.join(workdir, f"work_{rows}.xlsx"),
+            "verify": os.path.join(workdir, f"verify_{rows}.xlsx"),
+            "frame": os.path.join(workdir, f"frame_{rows}.pkl")}
+
+
+def bench_guests(path:str, load:bool = True, **kwargs):
+    """Crea un DataGuests que lee `path` en lugar de Data/guest.xlsx. Con `load` False no carga el archivo
+    al crearse, para poder medir después sólo `reload_excel`."""
+    from Class.DataGuests import DataGuests
+
+    class BenchGuests(DataGuests):
+        loaded = load
+
+        def find_path_guest_file(self):
+            return path
+
+        def reload_excel(self):
+            return super().reload_excel() if self.loaded else None
+
+    guests = BenchGuests(persist=False, **kwargs)
+    guests.loaded = True
+    return guests
+
+
+def prepare_inputs(rows:int, source:str, workdir:str) -> None:
+    """Prepara en un proceso aparte los archivos de entrada de las mediciones: el Excel normalizado y con caché,
+    una copia normalizada para path_verify_normalizado y el DataFrame de invitados para las mediciones de
+    base de datos."""
+    from Class.DataExcel import DataExcel
+
+    paths = input_paths(rows, workdir)
+    for path in (paths["work"], paths["verify"]):
+        shutil.copy(source, path)
+        DataExcel(path)
+    DataExcel(paths["work"], header="ID", dtype_str=True).load_excel()
+    bench_guests(paths["work"])._frame.to_pickle(paths["frame"])
+
+
+def run_step(step:str, rows:int, source:str, workdir:str, db_config:dict, results) -> None:
+    """Ejecuta una medición en el proceso actual y deja el resultado en la cola `results`."""
+    from Class.DataExcel import DataExcel
+
+    paths = input_paths(rows, workdir)
+    work = paths["work"]
+    extra = {}
+    try:
+        if step == "path_verify":
+            shutil.copy(source, paths["verify"])
+            start_rss = peak_rss_mb()
+            start = time.perf_counter()
+            DataExcel(paths["verify"], use_cache=False)
+        elif step == "path_verify_normalizado":
+            shutil.copy(work, paths["verify"])
+            start_rss = peak_rss_mb()
+            start = time.perf_counter()
+            DataExcel(paths["verify"], use_cache=False)
+        elif step == "load_excel":
+            excel = DataExcel(work, header="ID", dtype_str=True)
+            excel.use_cache = False
+            start_rss = peak_rss_mb()
+            start = time.perf_counter()
+            excel.load_excel()
+        elif step == "load_excel_cache":
+            excel = DataExcel(work, header="ID", dtype_str=True)
+            start_rss = peak_rss_mb()
+            start = time.perf_counter()
+            excel.load_excel()
+        elif step == "reload_excel":
+            # Sin caché, para medir la lectura del Excel y no la lectura del archivo Feather
+            guests = bench_guests(work, load=False)
+            guests.use_cache = False
+            start_rss = peak_rss_mb()
+            start = time.perf_counter()
+            guests.reload_excel()
+        elif step in ("from_dataframe_create_table", "from_dataframe_create_table_infile"):
+            frame = pd.read_pickle(paths["frame"])
+            db = connect_database(db_config, local_infile=step.endswith("_infile"))
+            start_rss = peak_rss_mb()
+            start = time.perf_counter()
+            db.from_dataframe_create_table(name_table=db.GUEST_TABLE, df=frame, indexes=["MESA"])
+            # Si el servidor no permite LOAD DATA LOCAL, la carga se hizo con INSERT por lotes
+            extra["local_infile"] = db.local_infile
+        elif step == "consultar_id_and_return_json":
+            db = connect_database(db_config)
+            # Los ID's vacíos del archivo se generan al azar en cada proceso, por eso se toman de la tabla creada
+            ids = [row[0] for row in db.select_from_table(name_table=db.GUEST_TABLE, columns=["ID"])]
+            if len(ids) != rows:
+                raise RuntimeError(f"La tabla {db.GUEST_TABLE} tiene {len(ids)} filas en lugar de {rows}")
+            ids = random.Random(0).choices(ids, k=LOOKUPS)
+            start_rss = peak_rss_mb()
+            start = time.perf_counter()
+            for id in ids:
+                db.consultar_id_and_return_json(id)
+            extra["consultas"] = LOOKUPS
+            extra["ms_por_consulta"] = round((time.perf_counter() - start) / LOOKUPS * 1000, 3)
+            extra["rows_per_s"] = None
+        else:
+            raise ValueError(f"Medición desconocida: {step}")
+        seconds = time.perf_counter() - start
+        extra["rss_inicial_mb"] = start_rss
+        results.put({"step": step, "rows": rows, "seconds": round(seconds, 4),
+                     "rows_per_s": round(rows / seconds, 1) if seconds > 0 else None,
+                     "peak_rss_mb": peak_rss_mb(), **extra})
+    except Exception as e:
+        results.put({"step": step, "rows": rows, "error": f"{e.__class__.__name__}: {e}"})
+
+
+def database_available(db_config:dict) -> str or None:
+    """Devuelve None si hay un servidor de prueba disponible, o el motivo por el que no se puede usar."""
+    try:
+        import pymysql
+        pymysql.connect(host=db_config["host"], port=db_config["port"], user=db_config["user"],
+                        password=db_config["password"], connect_timeout=3).close()
+        return None
+    except Exception as e:
+        return f"{e.__class__.__name__}: {e}"
+
+
+def git_commit() -> str or None:
+    """Commit actual del repositorio, para identificar los resultados."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def compare(baseline_path:str, results:list) -> None:
+    """Muestra la relación de tiempos entre una ejecución anterior y la actual."""
+    with open(baseline_path, encoding="utf-8") as file:
+        baseline = {(r["step"], r["rows"]): r for r in json.load(file)["results"] if "seconds" in r}
+    print(f"\nComparación con {baseline_path} (relación > 1 es más lento):")
+    for result in results:
+        before = baseline.get((result["step"], result["rows"]))
+        if before is None or "seconds" not in result:
+            continue
+        ratio = result["seconds"] / before["seconds"] if before["seconds"] else float("inf")
+        print(f"{result['step']:>30} {result['rows']:>8}: {before['seconds']:9.3f} s -> {result['seconds']:9.3f} s"
+              f"  x{ratio:5.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=SIZES, help="Tamaños de las listas de invitados")
+    parser.add_argument("--steps", nargs="+", default=STEPS, choices=STEPS, help="Mediciones a ejecutar")
+    parser.add_argument("--workdir", help="Carpeta para los archivos generados; se reutilizan entre ejecuciones")
+    parser.add_argument("--output", help="Archivo JSON de resultados. Por defecto, benchmarks/results/pipeline-<commit>-<fecha>.json")
+    parser.add_argument("--compare", help="Archivo JSON de una ejecución anterior para comparar")
+    parser.add_argument("--db-host", default=os.getenv("bench_db_host", "127.0.0.1"))
+    parser.add_argument("--db-port", type=int, default=int(os.getenv("bench_db_port", "3306")))
+    parser.add_argument("--db-user", default=os.getenv("bench_db_user", "root"))
+    parser.add_argument("--db-password", default=os.getenv("bench_db_password", ""))
+    parser.add_argument("--db-name", default=os.getenv("bench_db_name", "bench_invitados"))
+    args = parser.parse_args()
+    args.steps = [step for step in STEPS if step in args.steps]
+    if "consultar_id_and_return_json" in args.steps and not TABLE_STEPS & set(args.steps):
+        parser.error(f"consultar_id_and_return_json necesita una de {sorted(TABLE_STEPS)} para crear la tabla")
+
+    db_config = {"host": args.db_host, "port": args.db_port, "user": args.db_user, "password": args.db_password,
+                 "database": args.db_name}
+    db_error = database_available(db_config) if DB_STEPS & set(args.steps) else None
+    if db_error:
+        print(f"Sin servidor MySQL/MariaDB de prueba ({db_error}); se omiten {sorted(DB_STEPS)}")
+
+    commit = git_commit()
+    report = {"commit": commit, "fecha": datetime.datetime.now().isoformat(timespec="seconds"),
+              "python": platform.python_version(), "platform": platform.platform(), "pandas": pd.__version__,
+              "results": []}
+    context = multiprocessing.get_context("spawn")
+    workdir = args.workdir or tempfile.mkdtemp(prefix="bench_pipeline_")
+    os.makedirs(workdir, exist_ok=True)
+    try:
+        for rows in args.rows:
+            source = os.path.join(workdir, f"guest_{rows}.xlsx")
+            if not os.path.exists(source):
+                start = time.perf_counter()
+                create_synthetic_guest_file(source, rows)
+                print(f"Archivo sintético de {rows} filas creado en {time.perf_counter() - start:.1f} s")
+            # Los archivos de entrada se preparan en otro proceso, para no sumar esa memoria a las mediciones
+            process = context.Process(target=prepare_inputs, args=(rows, source, workdir))
+            process.start()
+            process.join()
+            prepare_error = None if process.exitcode == 0 else f"No se prepararon los archivos de entrada " \
+                                                               f"(código {process.exitcode})"
+            table_ready = False
+            for step in args.steps:
+                if prepare_error:
+                    report["results"].append({"step": step, "rows": rows, "error": prepare_error})
+                    print(f"{step:>30} {rows:>8}: error {prepare_error}")
+                    continue
+                if step in DB_STEPS and db_error:
+                    report["results"].append({"step": step, "rows": rows, "skipped": db_error})
+                    continue
+                if step == "consultar_id_and_return_json" and not table_ready:
+                    reason = f"no se creó la tabla de {rows} filas"
+                    report["results"].append({"step": step, "rows": rows, "skipped": reason})
+                    print(f"{step:>30} {rows:>8}: omitido, {reason}")
+                    continue
+                queue = context.Queue()
+                process = context.Process(target=run_step, args=(step, rows, source, workdir, db_config, queue))
+                process.start()
+                result = None
+                while result is None:
+                    try:
+                        result = queue.get(timeout=1)
+                    except Empty:
+                        if not process.is_alive():
+                            result = {"step": step, "rows": rows,
+                                      "error": f"El proceso terminó con código {process.exitcode}"}
+                process.join()
+                report["results"].append(result)
+                table_ready = table_ready or (step in TABLE_STEPS and "error" not in result)
+                if "error" in result:
+                    print(f"{step:>30} {rows:>8}: error {result['error']}")
+                else:
+                    print(f"{step:>30} {rows:>8}: {result['seconds']:9.3f} s  {result['peak_rss_mb']} MB"
+                          f"  (al empezar {result['rss_inicial_mb']} MB)")
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    output = args.output or os.path.join(
+        ROOT, "benchmarks", "results",
+        f"pipeline-{commit or 'sin-commit'}-{datetime.datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2, ensure_ascii=False)
+    print(f"Resultados guardados en {output}")
+    if args.compare:
+        compare(args.compare, report["results"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark del envío de WhatsApp con una o varias sesiones contra una página de chat falsa.
+
+Genera un archivo to_wsp.xlsx sintético y envía los mensajes de todas las filas con DataWsp, abriendo
+la página benchmarks/fake_wsp/chat.html desde el disco en lugar de WhatsApp Web. Requiere Chrome y
+selenium; las sesiones se abren sin ventana y sin pedir el código QR.
+
+Uso:
+    python benchmarks/bench_wsp_sessions.py --rows 20 --sessions 1 2 4
+"""
+import argparse
+import os
+import pathlib
+import random
+import string
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Class.DataWsp import DataWsp
+
+FAKE_CHAT = pathlib.Path(__file__).resolve().parent / "fake_wsp" / "chat.html"
+COLUMNS = ["ID", "SEX", "APELLIDOS", "NOMBRES", "NUMBER_GUEST", "MESA", "CELULAR", "MSJ"]
+
+
+def create_synthetic_wsp_file(path:str, rows:int) -> None:
+    """Crea un to_wsp.xlsx con `rows` invitados aleatorios; algunos sin celular para probar los errores."""
+    rng = random.Random(0)
+    data = [["".join(rng.choices(string.ascii_uppercase + string.digits, k=6)),
+             rng.choice("MF"),
+             "".join(rng.choices(string.ascii_uppercase, k=10)),
+             "".join(rng.choices(string.ascii_uppercase, k=8)),
+             str(rng.randint(1, 4)),
+             str(rng.randint(1, 40)),
+             "NULL" if r % 10 == 9 else str(rng.randint(900000000, 999999999)),
+             "NULL"] for r in range(rows)]
+    pd.DataFrame(data, columns=COLUMNS).to_excel(path, index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20, help="Cantidad de invitados")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 2, 4], help="Sesiones a comparar")
+    parser.add_argument("--delay", type=int, default=500, help="Milisegundos que tarda en cargar cada chat")
+    parser.add_argument("--send-delay", type=int, default=200, help="Milisegundos hasta el tick de enviado")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "to_wsp.xlsx")
+        create_synthetic_wsp_file(path, args.rows)
+        for sessions in args.sessions:
+            data = DataWsp(path=path)
+            data.wsp_url = FAKE_CHAT.as_uri()
+            data.send_url = FAKE_CHAT.as_uri() + f"?phone={{phone}}&delay={args.delay}&send_delay={args.send_delay}"
+            data.init_selenium_wsp(sessions=sessions, headless=True, login=False,
+                                   profiles=[os.path.join(workdir, f"perfil_{n}") for n in range(sessions)])
+            start = time.perf_counter()
+            try:
+                frame = data.apply_function_to_rows_in_sessions(data.message_from_data_in_row_selenium)
+            finally:
+                data.quit_selenium_wsp()
+            elapsed = time.perf_counter() - start
+            data.report_send_latency()
+            results = frame["message_from_data_in_row_selenium"]
+            expected = ["No se pudo enviar wsp" if pd.isna(celular) else "Se envió wsp" for celular in frame["CELULAR"]]
+            print(f"{sessions:>2} sesiones: {elapsed:8.1f} s  {args.rows / elapsed:6.2f} invitados/s  "
+                  f"orden correcto: {list(results) == expected}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Benchmark de DataExcel.transform_xls_to_xlsx contra la implementación anterior celda por celda.
+
+Genera un archivo .xls sintético con columnas como las de Data/guest.xlsx y mide el tiempo de conversión
+de ambas implementaciones. Requiere xlwt para crear el .xls de prueba (pip install xlwt).
+Como el formato .xls admite como máximo 65536 filas por hoja, las filas se reparten en varias hojas;
+la implementación anterior sólo convierte la primera, por lo que se reportan filas por segundo.
+Ambas implementaciones tienen una velocidad similar por fila: casi todo el tiempo se va en la escritura XML
+de openpyxl de cada celda con formato "@"; la diferencia es que la actual convierte todas las hojas con memoria
+constante.
+
+Uso:
+    python benchmarks/bench_xls_to_xlsx.py --rows 100000
+"""
+import argparse
+import os
+import random
+import shutil
+import string
+import sys
+import tempfile
+import time
+
+import openpyxl
+import xlrd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Class.DataExcel import DataExcel
+
+COLUMNS = ["ID", "SEX", "APELLIDOS", "NOMBRES", "NUMBER_GUEST", "MESA", "CELULAR", "CONFIRMADO"]
+ROWS_PER_SHEET = 50000
+
+
+def legacy_transform_xls_to_xlsx(file_path):
+    """Implementación anterior: copia sólo la primera hoja, celda por celda."""
+    wb=xlrd.open_workbook(file_path)
+    wb_xlsx = openpyxl.Workbook()
+    path_xlsx=file_path.replace(".xls",".xlsx")
+
+    sh = wb.sheet_by_index(0)
+    sh_destino = wb_xlsx.active
+
+    for r in range(sh.nrows):
+        for c in range(sh.ncols):
+            valor=sh.cell_value(r,c)
+            if valor is None:
+                sh_destino.cell(row=r+1, column=c+1).value = ""
+            else:
+                sh_destino.cell(row=r+1, column=c+1).value = str(valor)
+            sh_destino.cell(row=r+1, column=c+1).number_format = "@"
+
+    if os.path.exists(path_xlsx):
+        os.remove(path_xlsx)
+
+    wb_xlsx.save(path_xlsx)
+    wb_xlsx.close()
+    wb.release_resources()
+    os.remove(file_path)
+    return True
+
+
+def create_synthetic_xls(path:str, rows:int) -> None:
+    """Crea un .xls con `rows` invitados aleatorios repartidos en hojas de ROWS_PER_SHEET filas."""
+    import xlwt
+
+    rng = random.Random(0)
+    wb = xlwt.Workbook()
+    written = 0
+    sheet_number = 0
+    while written < rows or sheet_number == 0:
+        sheet_number += 1
+        sheet = wb.add_sheet(f"Hoja{sheet_number}")
+        for c, column in enumerate(COLUMNS):
+            sheet.write(0, c, column)
+        for r in range(1, min(ROWS_PER_SHEET, rows - written) + 1):
+            values = ["".join(rng.choices(string.ascii_uppercase + string.digits, k=6)),
+                      rng.choice("MF"),
+                      "".join(rng.choices(string.ascii_uppercase, k=12)),
+                      "".join(rng.choices(string.ascii_uppercase, k=10)),
+                      rng.randint(1, 6),
+                      rng.randint(1, 40),
+                      rng.randint(900000000, 999999999),
+                      rng.choice(["", "SI", "NO"])]
+            for c, value in enumerate(values):
+                sheet.write(r, c, value)
+        written += min(ROWS_PER_SHEET, rows - written)
+    wb.save(path)
+
+
+def time_conversion(function, source:str, workdir:str) -> tuple[float, int]:
+    """Convierte una copia de `source` y devuelve los segundos usados y las filas convertidas."""
+    path = os.path.join(workdir, "bench.xls")
+    shutil.copy(source, path)
+    start = time.perf_counter()
+    function(path)
+    elapsed = time.perf_counter() - start
+    wb = openpyxl.load_workbook(path.replace(".xls", ".xlsx"), read_only=True)
+    rows = 0
+    for sheet in wb.worksheets:
+        # Los libros de sólo escritura no guardan las dimensiones de la hoja, por eso se cuentan las filas
+        sheet.reset_dimensions()
+        rows += sum(1 for _ in sheet.iter_rows()) - 1
+    wb.close()
+    return elapsed, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000, help="Cantidad de filas del .xls sintético")
+    parser.add_argument("--repeat", type=int, default=1, help="Repeticiones de cada implementación")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        source = os.path.join(workdir, "source.xls")
+        create_synthetic_xls(source, args.rows)
+        print(f"Archivo sintético: {args.rows} filas, {os.path.getsize(source) / 1e6:.1f} MB")
+
+        for name, function in (("anterior", legacy_transform_xls_to_xlsx),
+                               ("por filas", DataExcel.transform_xls_to_xlsx)):
+            best = None
+            for _ in range(args.repeat):
+                elapsed, rows = time_conversion(function, source, workdir)
+                best = elapsed if best is None else min(best, elapsed)
+            print(f"{name:>10}: {best:8.2f} s  {rows:>8} filas  {rows / best:10.0f} filas/s")
+
+
+if __name__ == "__main__":
+    main()
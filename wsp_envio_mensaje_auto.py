@@ -1,5 +1,12 @@
-import re
+import os
 from Class.DataWsp import DataWsp
 
 data=DataWsp()
-data.MultipleMessageFromDataInRowSelenium()
\ No newline at end of file
+# Con wsp_dry_run=1 sólo se guardan los mensajes en Data/wsp_preview__<fecha>.xlsx para revisarlos, sin enviarlos.
+if os.getenv('wsp_dry_run','0') == '1':
+    data.dry_run_wsp()
+    raise SystemExit
+# Cantidad de sesiones de WhatsApp (cuentas) entre las que se reparten los envíos.
+# Con wsp_resume=1 se saltan los números que ya se enviaron en una ejecución anterior.
+data.MultipleMessageFromDataInRowSelenium(sessions=int(os.getenv('wsp_sessions','1')),
+                                          resume=os.getenv('wsp_resume','0') == '1')
\ No newline at end of file